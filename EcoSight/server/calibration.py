@@ -14,6 +14,10 @@ Usage:
     python calibration.py
 """
 
+import ast
+import os
+import pathlib
+
 import cv2
 import numpy as np
 from ultralytics import YOLO
@@ -53,18 +57,21 @@ def run_calibration():
         results = model(frame, verbose=False, conf=0.5)
         annotated = results[0].plot()
 
-        # Show pixel heights of all detected objects
+        # Show pixel heights of all detected objects.
+        # Pull the tensors to NumPy once — per-box .xyxy[0]/.cls[0] indexing
+        # forces a device sync and a Python float conversion per detection.
         boxes = results[0].boxes
-        if boxes is not None:
-            for i, box in enumerate(boxes):
-                x1, y1, x2, y2 = box.xyxy[0].tolist()
-                cls_id = int(box.cls[0])
-                cls_name = model.names[cls_id]
-                px_height = int(y2 - y1)
-
-                label = f"{cls_name}: {px_height}px"
+        xy = np.empty((0, 4))
+        cls_ids = np.empty(0, int)
+        if boxes is not None and len(boxes) > 0:
+            xy = boxes.xyxy.cpu().numpy()
+            cls_ids = boxes.cls.cpu().numpy().astype(int)
+            heights = (xy[:, 3] - xy[:, 1]).astype(int)
+
+            for i in range(len(cls_ids)):
+                label = f"{model.names[int(cls_ids[i])]}: {heights[i]}px"
                 cv2.putText(annotated, label,
-                            (int(x1), int(y1) - 10),
+                            (int(xy[i, 0]), int(xy[i, 1]) - 10),
                             cv2.FONT_HERSHEY_SIMPLEX, 0.6,
                             (0, 255, 0), 2)
 
@@ -80,27 +87,20 @@ def run_calibration():
             break
 
         if key == ord('c'):
-            if boxes is None or len(boxes) == 0:
+            if len(cls_ids) == 0:
                 print("[WARN] No objects detected! Make sure something is visible.")
                 continue
 
-            # Use the largest detected object
-            heights = []
-            for box in boxes:
-                x1, y1, x2, y2 = box.xyxy[0].tolist()
-                cls_id = int(box.cls[0])
-                heights.append({
-                    "class": model.names[cls_id],
-                    "pixel_height": y2 - y1,
-                })
-            heights.sort(key=lambda h: h["pixel_height"], reverse=True)
-            chosen = heights[0]
-
-            focal_constant = 1.0 * chosen["pixel_height"]
+            # Use the tallest detected object
+            idx = int(np.argmax(xy[:, 3] - xy[:, 1]))
+            chosen_name = model.names[int(cls_ids[idx])]
+            chosen_height = float(xy[idx, 3] - xy[idx, 1])
+
+            focal_constant = 1.0 * chosen_height
             print()
             print(f"[CALIBRATION RESULT]")
-            print(f"  Object: {chosen['class']}")
-            print(f"  Pixel height at 1m: {chosen['pixel_height']:.0f}px")
+            print(f"  Object: {chosen_name}")
+            print(f"  Pixel height at 1m: {chosen_height:.0f}px")
             print(f"  FOCAL_CONSTANT = {focal_constant:.1f}")
             print()
 
@@ -120,17 +120,34 @@ def run_calibration():
 
 
 def _update_config_file(new_value: float):
-    """Overwrite FOCAL_CONSTANT in config.py."""
+    """
+    Overwrite FOCAL_CONSTANT in config.py.
+
+    Locates the assignment by parsing the file instead of scanning for a
+    string prefix (which would also match e.g. FOCAL_CONSTANT_FOO or
+    commented-out lines), and replaces the file atomically so a crash
+    mid-write can't leave a truncated config.
+    """
     config_path = "config.py"
-    with open(config_path, "r") as f:
-        lines = f.readlines()
-
-    with open(config_path, "w") as f:
-        for line in lines:
-            if line.strip().startswith("FOCAL_CONSTANT"):
-                f.write(f"FOCAL_CONSTANT = {new_value:.1f}\n")
-            else:
-                f.write(line)
+    src = pathlib.Path(config_path).read_text()
+
+    target_line = None
+    for node in ast.parse(src).body:
+        if isinstance(node, ast.Assign):
+            for target in node.targets:
+                if isinstance(target, ast.Name) and target.id == "FOCAL_CONSTANT":
+                    target_line = node.lineno
+                    break
+    if target_line is None:
+        print("[ERROR] FOCAL_CONSTANT assignment not found in config.py")
+        return
+
+    lines = src.splitlines(keepends=True)
+    lines[target_line - 1] = f"FOCAL_CONSTANT = {new_value:.1f}\n"
+
+    tmp_path = config_path + ".tmp"
+    pathlib.Path(tmp_path).write_text("".join(lines))
+    os.replace(tmp_path, config_path)
 
 
 if __name__ == "__main__":
@@ -5,6 +5,7 @@ and prevent laptop overheating.
 """
 
 import cv2
+import threading
 import time
 import config
 
@@ -16,6 +17,12 @@ class CameraManager:
     Only yields every Nth frame for processing — the rest are
     grabbed‑and‑discarded so the camera buffer stays fresh.
     This keeps latency < 100ms even on modest hardware.
+
+    With CAMERA_CAPTURE_THREAD enabled, a daemon producer thread drains
+    the driver continuously into a latest-wins slot instead: read()
+    always hands back the newest decoded frame (or None if nothing new
+    arrived), so inference stalls never back up the OS camera buffer
+    and no skip counting is needed.
     """
 
     def __init__(self):
@@ -23,10 +30,18 @@ class CameraManager:
         self.frame_skip = config.FRAME_SKIP           # process every Nth frame
         self._frame_counter = 0
         self._last_yield_time = 0.0
+        self._capture_thread: threading.Thread | None = None
+        self._capture_running = False
+        self._latest = None
+        self._latest_lock = threading.Lock()
 
     def open(self) -> None:
         """Open and configure the webcam."""
         self.cap = cv2.VideoCapture(config.CAMERA_INDEX)
+        # Ask for MJPG before negotiating resolution — UVC webcams encode
+        # JPEG in hardware, so capture avoids the CPU-side YUYV conversion
+        # OpenCV otherwise lands on (decode then goes through libjpeg-turbo).
+        self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
         self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, config.FRAME_WIDTH)
         self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, config.FRAME_HEIGHT)
         # Minimise internal buffer to reduce stale‑frame latency
@@ -36,37 +51,77 @@ class CameraManager:
                 f"Cannot open webcam (index {config.CAMERA_INDEX}). "
                 "Check CAMERA_INDEX in config.py"
             )
+        if config.CAMERA_CAPTURE_THREAD:
+            self._capture_running = True
+            self._capture_thread = threading.Thread(
+                target=self._capture_loop, daemon=True, name="camera-capture"
+            )
+            self._capture_thread.start()
         print(f"[CAM] Camera opened (index={config.CAMERA_INDEX}, "
-              f"skip={self.frame_skip})")
+              f"skip={self.frame_skip}, "
+              f"thread={'on' if config.CAMERA_CAPTURE_THREAD else 'off'})")
+
+    def _capture_loop(self) -> None:
+        """Producer: keep only the newest frame, overwriting stale ones."""
+        while self._capture_running:
+            ret, frame = self.cap.read()
+            if ret:
+                with self._latest_lock:
+                    self._latest = frame
+            else:
+                time.sleep(0.005)
 
     def read(self):
         """
         Read the next frame.
 
+        Skipped frames are only grab()'d — the JPEG/YUV decode and the
+        ndarray allocation of a full read() are paid solely for the
+        frames we actually process (1-of-FRAME_SKIP).
+
         Returns:
             (should_process: bool, frame: ndarray | None)
-            - should_process=True  → this is the frame to run YOLO on
-            - should_process=False → frame was grabbed but skipped
-            - frame=None           → camera error (retry)
+            - should_process=True  → decoded frame to run YOLO on
+            - should_process=False → frame grabbed-and-dropped, or camera
+                                     error (frame is None either way; retry)
         """
         if self.cap is None:
             raise RuntimeError("Camera not opened. Call open() first.")
 
-        ret, frame = self.cap.read()
-        if not ret:
+        if self._capture_thread is not None:
+            # Latest-wins handoff: take the slot (zero-copy) and leave it
+            # empty so the same frame is never processed twice.
+            with self._latest_lock:
+                frame, self._latest = self._latest, None
+            if frame is None:
+                return False, None
+            self._last_yield_time = time.perf_counter()
+            return True, frame
+
+        # grab() blocks until the sensor delivers a frame but skips the
+        # decode, so draining the buffer costs almost nothing.
+        if not self.cap.grab():
             return False, None
 
         self._frame_counter += 1
 
-        # Only process every Nth frame
+        # Only decode + process every Nth frame
         if self._frame_counter % self.frame_skip != 0:
-            return False, frame          # skipped — still return frame for display
+            return False, None
+
+        ret, frame = self.cap.retrieve()
+        if not ret:
+            return False, None
 
         self._last_yield_time = time.perf_counter()
         return True, frame               # process this one
 
     def release(self) -> None:
         """Release the webcam."""
+        if self._capture_thread is not None:
+            self._capture_running = False
+            self._capture_thread.join(timeout=1.0)
+            self._capture_thread = None
         if self.cap:
             self.cap.release()
             print("[CAM] Camera released")
@@ -75,4 +130,6 @@ class CameraManager:
     def effective_fps(self) -> float:
         """Estimated effective processing FPS after skip."""
         raw_fps = self.cap.get(cv2.CAP_PROP_FPS) if self.cap else 30.0
+        if config.CAMERA_CAPTURE_THREAD:
+            return raw_fps
         return raw_fps / self.frame_skip
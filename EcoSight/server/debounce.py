@@ -5,8 +5,19 @@ which would cause TTS to talk over itself and overwhelm the user.
 """
 
 import time
+
+import numpy as np
+
 import config
 
+# Arrays are indexed by COCO class id — one slot per class id we track.
+_NUM_CLASS_SLOTS = max(config.HAZARD_CLASSES) + 1
+
+# Boolean lookup mirroring the scalar path's `hazard in config.HAZARD_IDS`
+# guard — batch inputs are masked through it before any array indexing.
+_IS_HAZARD = np.zeros(_NUM_CLASS_SLOTS, bool)
+_IS_HAZARD[list(config.HAZARD_IDS)] = True
+
 
 class HazardDebouncer:
     """
@@ -18,46 +29,105 @@ class HazardDebouncer:
 
     Also implements a global minimum interval so the phone never
     receives more than one alert in any given time window.
+
+    State lives in three fixed NumPy arrays indexed by class id, so the
+    10 Hz hot path does plain index reads/writes instead of allocating
+    per-alert dicts, and batch filtering is a single vectorized call.
     """
 
     def __init__(self):
-        # { "hazard_name": { "last_time": float, "last_dist": float } }
-        self._history: dict[str, dict] = {}
+        self._name_to_id = {name: cid for cid, name in config.HAZARD_CLASSES.items()}
+        self._last_time = np.zeros(_NUM_CLASS_SLOTS, np.float64)
+        self._last_dist = np.zeros(_NUM_CLASS_SLOTS, np.float32)
+        self._valid = np.zeros(_NUM_CLASS_SLOTS, bool)
         self._global_last_time: float = 0.0
         self.cooldown = config.DEBOUNCE_COOLDOWN_SEC
         self.global_min_interval = config.DEBOUNCE_GLOBAL_MIN_SEC
         self.distance_change_threshold = config.DEBOUNCE_DISTANCE_CHANGE
 
-    def should_alert(self, hazard: str, distance: float) -> bool:
+    def should_alert(self, hazard: str | int, distance: float, now: float | None = None) -> bool:
         """
         Returns True if this hazard should be announced to the user.
 
         Args:
-            hazard:   hazard class name (e.g. "person", "puddle")
+            hazard:   COCO class id (canonical) or hazard class name
             distance: estimated distance in metres
+            now:      caller-supplied time.monotonic() reading, so a frame
+                      that checks several hazards pays one clock syscall
         """
-        now = time.monotonic()
+        if isinstance(hazard, str):
+            hazard_id = self._name_to_id.get(hazard)
+        else:
+            hazard_id = hazard if hazard in config.HAZARD_IDS else None
+        if hazard_id is None:
+            return False
+
+        if now is None:
+            now = time.monotonic()
 
         # ── Global rate‑limit ─────────────────────────────────
         if now - self._global_last_time < self.global_min_interval:
             return False
 
         # ── Per‑hazard cooldown ───────────────────────────────
-        if hazard in self._history:
-            entry = self._history[hazard]
-            elapsed = now - entry["last_time"]
-            dist_delta = abs(distance - entry["last_dist"])
+        if self._valid[hazard_id]:
+            elapsed = now - self._last_time[hazard_id]
+            dist_delta = abs(distance - self._last_dist[hazard_id])
 
             # Still within cooldown AND distance hasn't changed much
             if elapsed < self.cooldown and dist_delta < self.distance_change_threshold:
                 return False
 
         # ── Allow alert — update history ──────────────────────
-        self._history[hazard] = {"last_time": now, "last_dist": distance}
+        self._last_time[hazard_id] = now
+        self._last_dist[hazard_id] = distance
+        self._valid[hazard_id] = True
         self._global_last_time = now
         return True
 
+    def should_alert_batch(
+        self, ids: np.ndarray, dists: np.ndarray, now: float | None = None
+    ) -> np.ndarray:
+        """
+        Vectorized variant: one boolean per (class id, distance) pair.
+
+        History is updated for every allowed entry, exactly as repeated
+        `should_alert` calls would, so the mask can be used to filter a
+        whole frame's detections at once. Ids outside the tracked hazard
+        set come back False, matching the scalar path.
+        """
+        ids = np.asarray(ids, dtype=np.intp)
+        dists = np.asarray(dists, dtype=np.float32)
+
+        if now is None:
+            now = time.monotonic()
+        if now - self._global_last_time < self.global_min_interval:
+            return np.zeros(len(ids), bool)
+
+        is_hazard = (ids >= 0) & (ids < _NUM_CLASS_SLOTS)
+        is_hazard[is_hazard] = _IS_HAZARD[ids[is_hazard]]
+        # Non-hazard slots index 0 harmlessly; is_hazard zeroes them out.
+        safe_ids = np.where(is_hazard, ids, 0)
+
+        elapsed = now - self._last_time[safe_ids]
+        dist_delta = np.abs(dists - self._last_dist[safe_ids])
+        suppressed = (
+            self._valid[safe_ids]
+            & (elapsed < self.cooldown)
+            & (dist_delta < self.distance_change_threshold)
+        )
+        allowed = is_hazard & ~suppressed
+
+        if allowed.any():
+            allowed_ids = ids[allowed]
+            self._last_time[allowed_ids] = now
+            self._last_dist[allowed_ids] = dists[allowed]
+            self._valid[allowed_ids] = True
+            self._global_last_time = now
+
+        return allowed
+
     def reset(self) -> None:
         """Clear all cooldown history (e.g. when switching modes)."""
-        self._history.clear()
+        self._valid[:] = False
         self._global_last_time = 0.0
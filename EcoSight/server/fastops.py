@@ -0,0 +1,191 @@
+"""
+EcoSight Phase 1 — Compiled Numeric Kernels
+Small hot-path arithmetic (heuristic depth, direction zoning) compiled
+with Numba when it is installed; the same functions run as plain Python
+otherwise, so numba stays an optional dependency like the other
+accelerated backends.
+
+Kernels use cache=True so the JIT cost is paid once per machine, not
+per process start.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op decorator when numba is not installed."""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+        return wrap
+
+
+# Index → direction name for zone ids produced by zone_ids()
+ZONE_NAMES = np.array(["left", "center", "right"])
+
+
+@njit(cache=True, fastmath=True)
+def heuristic_depths(xyxy: np.ndarray, focal: float, min_dist: float) -> np.ndarray:
+    """Monocular depth per box: focal / pixel_height, clamped to min_dist."""
+    n = xyxy.shape[0]
+    dists = np.empty(n, np.float32)
+    for i in range(n):
+        pixel_height = xyxy[i, 3] - xyxy[i, 1]
+        if pixel_height < 1.0:
+            pixel_height = 1.0
+        d = focal / pixel_height
+        if d < min_dist:
+            d = min_dist
+        dists[i] = d
+    return dists
+
+
+@njit(cache=True, fastmath=True)
+def merge_keep(
+    boxes: np.ndarray, distances: np.ndarray, iou_thr: float, center_thr: float
+) -> np.ndarray:
+    """
+    Greedy nearest-first duplicate merge over (N,4) float32 boxes.
+
+    Returns indices (into `boxes`, sorted by ascending distance) of boxes
+    that are not a duplicate of an already-kept box, where duplicate means
+    IoU >= iou_thr or L1 centre distance <= center_thr. The O(N²) scalar
+    loop compiles to a tight LLVM kernel under numba.
+    """
+    order = np.argsort(distances, kind="mergesort")
+    n = order.shape[0]
+    kept = np.empty(n, np.intp)
+    n_kept = 0
+    for oi in range(n):
+        i = order[oi]
+        x1, y1, x2, y2 = boxes[i, 0], boxes[i, 1], boxes[i, 2], boxes[i, 3]
+        area_i = max(x2 - x1, 0.0) * max(y2 - y1, 0.0)
+        cx_i = (x1 + x2) * 0.5
+        cy_i = (y1 + y2) * 0.5
+        duplicate = False
+        for kj in range(n_kept):
+            j = kept[kj]
+            kx1, ky1, kx2, ky2 = boxes[j, 0], boxes[j, 1], boxes[j, 2], boxes[j, 3]
+            center_delta = abs(cx_i - (kx1 + kx2) * 0.5) + abs(cy_i - (ky1 + ky2) * 0.5)
+            if center_delta <= center_thr:
+                duplicate = True
+                break
+            iw = min(x2, kx2) - max(x1, kx1)
+            ih = min(y2, ky2) - max(y1, ky1)
+            if iw > 0.0 and ih > 0.0:
+                inter = iw * ih
+                area_j = max(kx2 - kx1, 0.0) * max(ky2 - ky1, 0.0)
+                union = area_i + area_j - inter
+                if union > 0.0 and inter / union >= iou_thr:
+                    duplicate = True
+                    break
+        if not duplicate:
+            kept[n_kept] = i
+            n_kept += 1
+    return kept[:n_kept]
+
+
+@njit(cache=True, fastmath=True)
+def path_merge_keep(
+    boxes: np.ndarray,
+    distances: np.ndarray,
+    frame_w: float,
+    frame_h: float,
+    x_start: float,
+    x_end: float,
+    min_bottom: float,
+    min_d: float,
+    max_d: float,
+    iou_thr: float,
+    center_thr: float,
+) -> np.ndarray:
+    """
+    Fused forward-path filter + duplicate merge over (N,4) float32 boxes.
+
+    Zone test compares x1+x2 against doubled ratio bounds (no division),
+    then the survivors go through the same greedy nearest-first merge as
+    merge_keep. Returns kept indices into `boxes`, ascending by distance.
+    """
+    n = boxes.shape[0]
+    sel = np.empty(n, np.intp)
+    n_sel = 0
+    x_lo = 2.0 * x_start * frame_w
+    x_hi = 2.0 * x_end * frame_w
+    y_min = min_bottom * frame_h
+    for i in range(n):
+        cx2 = boxes[i, 0] + boxes[i, 2]
+        if (
+            x_lo <= cx2 <= x_hi
+            and boxes[i, 3] >= y_min
+            and min_d <= distances[i] <= max_d
+        ):
+            sel[n_sel] = i
+            n_sel += 1
+    if n_sel == 0:
+        return sel[:0]
+    sel = sel[:n_sel]
+    kept = merge_keep(boxes[sel], distances[sel], iou_thr, center_thr)
+    return sel[kept]
+
+
+@njit(cache=True, fastmath=True)
+def greedy_match(cost: np.ndarray, max_delta: float) -> np.ndarray:
+    """
+    Greedy nearest-unused assignment over an (N_det, N_trk) cost matrix.
+
+    Detections are visited in order; each takes the cheapest still-free
+    track within max_delta. Returns the matched track index per
+    detection, -1 where a new track should be created.
+    """
+    n_det, n_trk = cost.shape
+    out = np.full(n_det, -1, np.intp)
+    used = np.zeros(n_trk, np.bool_)
+    for i in range(n_det):
+        best_j = -1
+        best_c = max_delta + 1.0   # finite sentinel (fastmath-safe)
+        for j in range(n_trk):
+            if not used[j] and cost[i, j] < best_c:
+                best_c = cost[i, j]
+                best_j = j
+        if best_j >= 0 and best_c <= max_delta:
+            out[i] = best_j
+            used[best_j] = True
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def zone_ids(xyxy: np.ndarray, frame_w: float, left_end: float, right_start: float) -> np.ndarray:
+    """Classify each box centre-x into 0=left, 1=center, 2=right."""
+    n = xyxy.shape[0]
+    zones = np.empty(n, np.int8)
+    for i in range(n):
+        ratio = (xyxy[i, 0] + xyxy[i, 2]) / (2.0 * frame_w)
+        if ratio < left_end:
+            zones[i] = 0
+        elif ratio > right_start:
+            zones[i] = 2
+        else:
+            zones[i] = 1
+    return zones
+
+
+if NUMBA_AVAILABLE:
+    # Touch every kernel once at import so compilation (or loading the
+    # on-disk cache) happens at startup, not on the first live frame.
+    _warm = np.zeros((1, 4), np.float32)
+    heuristic_depths(_warm, 1.0, 0.3)
+    zone_ids(_warm, 1.0, 0.33, 0.66)
+    merge_keep(_warm, np.zeros(1, np.float32), 0.45, 60.0)
+    path_merge_keep(_warm, np.zeros(1, np.float32), 640.0, 480.0,
+                    0.25, 0.75, 0.5, 0.3, 8.0, 0.45, 60.0)
+    greedy_match(np.zeros((1, 1), np.float32), 120.0)
+    del _warm
@@ -13,6 +13,8 @@ Architecture:
 """
 
 import asyncio
+import concurrent.futures
+import functools
 import json
 import time
 import threading
@@ -20,12 +22,41 @@ import platform
 import os
 import cv2
 import numpy as np
+import torch
 import websockets
 import pyttsx3
 
+# orjson parses/serializes several times faster than stdlib json.
+# Serialized payloads decode back to str so the wire keeps carrying
+# TEXT websocket frames — the Flutter client casts incoming messages to
+# String, and a binary frame would arrive as Uint8List and be dropped.
+# The decode is trivial next to the serialize + fan-out cost.
+try:
+    import orjson
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    _json_loads = orjson.loads
+except ImportError:                    # pragma: no cover — orjson is in requirements
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+# uvloop swaps the stock selector event loop for a libuv-backed one in C —
+# roughly 2× faster loop dispatch, which the send/sleep/executor-heavy
+# Phase 1 loop hits constantly. Linux/macOS only; optional like orjson.
+if platform.system() != "Windows":
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:                # pragma: no cover — optional accelerator
+        pass
+
 import config
+import fastops
 from camera import CameraManager
 from phase1_reflex import ReflexLayer
+from phase1_worker import InferenceWorker
 from phase2_context import ContextLayer
 from debounce import HazardDebouncer
 from schema import build_phase1_payload, build_phase2_payload, build_pong
@@ -39,8 +70,12 @@ class ServerState:
     """Mutable shared state across the event loop."""
     def __init__(self):
         self.clients: set = set()
-        self.current_frame: np.ndarray | None = None
+        # Dedicated Phase-2 snapshot buffer — OpenCV reuses the capture
+        # buffer across read()s, so Phase 2 copies into its own ndarray
+        # instead of holding a reference that the next frame overwrites.
+        self.phase2_frame: np.ndarray | None = None
         self.phase2_requested = False
+        self.phase2_inflight: asyncio.Future | None = None
         self.running = True
 
 
@@ -50,25 +85,33 @@ reflex = ReflexLayer() if not SERVER_ONLY_MODE else None
 context = None
 debouncer = HazardDebouncer() if not SERVER_ONLY_MODE else None
 
+# Single dedicated Florence-2 worker. The default executor allows
+# min(32, cpu+4) threads, so a burst of Phase-2 triggers could run
+# several Florence-2 inferences in parallel and OOM the laptop.
+phase2_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="phase2"
+)
+
 # ─── Server-Side TTS (runs on laptop speakers) ──────────────────
 import queue
 
-_tts_queue: queue.Queue = queue.Queue()
+# Single-worker executor keeps speech serialized without a hand-rolled
+# queue + thread; latest-wins slot coalesces alerts that pile up while
+# an earlier one is still being spoken.
+_tts_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="tts"
+)
+_tts_lock = threading.Lock()
+_tts_latest: str | None = None
+_tts_engine = None
 
 
-def _speak_pyttsx3(text: str) -> bool:
-    """Speak text using pyttsx3."""
-    try:
-        engine = pyttsx3.init()
-        engine.setProperty('rate', 170)
-        engine.setProperty('volume', 1.0)
-        engine.say(text)
-        engine.runAndWait()
-        engine.stop()
-        return True
-    except Exception as e:
-        print(f"[TTS] pyttsx3 error: {e}")
-        return False
+def _init_tts_engine():
+    """Build a configured pyttsx3 engine (one driver/COM init)."""
+    engine = pyttsx3.init()
+    engine.setProperty('rate', 170)
+    engine.setProperty('volume', 1.0)
+    return engine
 
 
 def _beep_fallback() -> bool:
@@ -84,117 +127,171 @@ def _beep_fallback() -> bool:
         print(f"[TTS] Beep fallback error: {e}")
         return False
 
-def _tts_worker():
-    """Single dedicated TTS thread with stable speech + beep fallback."""
-    print("[TTS] Worker ready (backend=pyttsx3)")
-    while True:
-        text = _tts_queue.get()  # blocks until something is queued
-        if text is None:
-            break
+def _speak_latest():
+    """
+    Runs on the TTS executor: speak the newest queued alert, if any.
+
+    The persistent engine is built once (pyttsx3.init() costs 50-300ms
+    of SAPI5/eSpeak driver setup) and re-initialized only on failure.
+    """
+    global _tts_engine, _tts_latest
+
+    with _tts_lock:
+        text, _tts_latest = _tts_latest, None
+    if text is None:
+        return                    # an earlier task already spoke this alert
+    print(f"[TTS-SPEAK] {text}")
+
+    spoke = False
+    for attempt in range(2):
         try:
-            # Drain any newer messages — only speak the latest relevant alert
-            while not _tts_queue.empty():
-                text = _tts_queue.get_nowait()
-            print(f"[TTS-SPEAK] {text}")
-
-            spoke = _speak_pyttsx3(text)
-            if not spoke:
-                spoke = _beep_fallback()
-                if spoke:
-                    print("[TTS] Speech unavailable, played beep fallback")
-
-            if not spoke:
-                print("[TTS] All speech backends failed for this alert")
+            if _tts_engine is None:
+                _tts_engine = _init_tts_engine()
+            _tts_engine.say(text)
+            _tts_engine.runAndWait()
+            spoke = True
+            break
         except Exception as e:
-            print(f"[TTS] Error: {e}")
+            print(f"[TTS] pyttsx3 error: {e}")
+            _tts_engine = None    # force re-init on retry / next alert
+    if not spoke:
+        spoke = _beep_fallback()
+        if spoke:
+            print("[TTS] Speech unavailable, played beep fallback")
+
+    if not spoke:
+        print("[TTS] All speech backends failed for this alert")
 
-# Start the TTS worker thread once
-_tts_thread = threading.Thread(target=_tts_worker, daemon=True)
-_tts_thread.start()
 
 def speak_alert(text: str):
-    """Queue text for the TTS worker thread."""
-    _tts_queue.put(text)
+    """Queue text for speech; only the newest pending alert is spoken."""
+    global _tts_latest
+    with _tts_lock:
+        _tts_latest = text
+    _tts_executor.submit(_speak_latest)
 
 
-def _box_center(box: list[int]) -> tuple[float, float]:
-    x1, y1, x2, y2 = box
-    return ((x1 + x2) / 2.0, (y1 + y2) / 2.0)
+# ─── Judge View worker (runs off the event loop) ────────────────
+_vis_queue: queue.Queue = queue.Queue(maxsize=1)
 
 
-def _box_iou(box_a: list[int], box_b: list[int]) -> float:
-    ax1, ay1, ax2, ay2 = box_a
-    bx1, by1, bx2, by2 = box_b
+@functools.lru_cache(maxsize=256)
+def _label_size(label: str) -> tuple[int, int]:
+    """cv2.getTextSize, memoized — labels repeat across frames since the
+    hazard set is fixed and distances are rounded to 0.1m."""
+    (w, h), _ = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 1)
+    return w, h
 
-    inter_x1 = max(ax1, bx1)
-    inter_y1 = max(ay1, by1)
-    inter_x2 = min(ax2, bx2)
-    inter_y2 = min(ay2, by2)
 
-    inter_w = max(0, inter_x2 - inter_x1)
-    inter_h = max(0, inter_y2 - inter_y1)
-    inter_area = inter_w * inter_h
+@functools.lru_cache(maxsize=64)
+def _status_text(count: int) -> str:
+    return f"Phase 1: Active | Hazards: {count}"
 
-    area_a = max(0, ax2 - ax1) * max(0, ay2 - ay1)
-    area_b = max(0, bx2 - bx1) * max(0, by2 - by1)
-    union = area_a + area_b - inter_area
-    if union <= 0:
-        return 0.0
-    return inter_area / union
+
+def _vis_worker():
+    """
+    Dedicated rendering thread for the Judge View window.
+
+    cv2.imshow/waitKey pump the GUI message loop synchronously (1-3ms per
+    call), so running them here keeps that cost off the asyncio thread.
+    The maxsize-1 queue drops stale frames instead of backlogging.
+    """
+    cv2.namedWindow("Judge View", cv2.WINDOW_NORMAL)
+    cv2.resizeWindow("Judge View", 800, 600)
+    while state.running:
+        try:
+            frame, detections = _vis_queue.get(timeout=0.5)
+        except queue.Empty:
+            continue
+        for det in detections:
+            x1, y1, x2, y2 = det.get("box", [0, 0, 0, 0])
+            label = f"{det['hazard']} {det['distance']}m"
+            color = (0, 0, 255) # Red for danger
+
+            cv2.rectangle(frame, (x1, y1), (x2, y2), color, 2)
+            w, h = _label_size(label)
+            cv2.rectangle(frame, (x1, y1 - 20), (x1 + w, y1), color, -1)
+            cv2.putText(frame, label, (x1, y1 - 5),
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1)
+
+        cv2.putText(frame, _status_text(len(detections)), (10, 30),
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
+
+        cv2.imshow("Judge View", frame)
+        if cv2.waitKey(1) & 0xFF == ord('q'):
+            state.running = False
+            break
+    cv2.destroyAllWindows()
+
+
+def _show_judge_view(frame: np.ndarray, detections: list[dict]) -> None:
+    """Hand a frame to the vis worker, replacing any undrawn stale frame."""
+    try:
+        _vis_queue.put_nowait((frame, detections))
+    except queue.Full:
+        try:
+            _vis_queue.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            _vis_queue.put_nowait((frame, detections))
+        except queue.Full:
+            pass
 
 
 def _match_target_detection(detections: list[dict], tracked: dict) -> dict | None:
     """
     Find the best matching detection for the currently tracked target.
-    Match by hazard class + closest box center.
+    Match by hazard class + closest box center (precomputed cx/cy).
     """
     if not tracked:
         return None
 
-    tracked_center = _box_center(tracked["box"])
-    candidates = [d for d in detections if d["hazard"] == tracked["hazard"]]
+    tracked_cx, tracked_cy = tracked["cx"], tracked["cy"]
+    candidates = [d for d in detections if d["hazard_id"] == tracked["hazard_id"]]
     if not candidates:
         return None
 
     best = min(
         candidates,
-        key=lambda d: abs(_box_center(d["box"])[0] - tracked_center[0]) + abs(_box_center(d["box"])[1] - tracked_center[1]),
+        key=lambda d: abs(d["cx"] - tracked_cx) + abs(d["cy"] - tracked_cy),
     )
-    best_center = _box_center(best["box"])
-    center_delta = abs(best_center[0] - tracked_center[0]) + abs(best_center[1] - tracked_center[1])
+    center_delta = abs(best["cx"] - tracked_cx) + abs(best["cy"] - tracked_cy)
 
     if center_delta > config.TARGET_MATCH_CENTER_TOLERANCE_PX:
         return None
     return best
 
 
-def _pick_next_target(detections: list[dict], exclude_box: list[int] | None = None) -> dict | None:
-    """Pick nearest detection, optionally excluding a specific box."""
+def _pick_next_target(detections: list[dict], exclude: dict | None = None) -> dict | None:
+    """Pick nearest detection, optionally excluding one (by centre distance)."""
     if not detections:
         return None
 
-    if exclude_box is None:
+    if exclude is None:
         return detections[0]
 
-    ex_cx, ex_cy = _box_center(exclude_box)
+    ex_cx, ex_cy = exclude["cx"], exclude["cy"]
     for det in detections:
-        cx, cy = _box_center(det["box"])
-        if abs(cx - ex_cx) + abs(cy - ex_cy) > config.TARGET_MATCH_CENTER_TOLERANCE_PX:
+        if abs(det["cx"] - ex_cx) + abs(det["cy"] - ex_cy) > config.TARGET_MATCH_CENTER_TOLERANCE_PX:
             return det
     return None
 
 
-def _is_in_forward_path_zone(box: list[int], frame_shape: tuple[int, int, int]) -> bool:
-    """Return True if a detection is inside the forward walking/driving path."""
-    frame_h, frame_w = frame_shape[0], frame_shape[1]
-    x1, y1, x2, y2 = box
-    center_x = (x1 + x2) / 2.0
-    center_ratio = center_x / max(frame_w, 1)
-    bottom_ratio = y2 / max(frame_h, 1)
+@functools.lru_cache(maxsize=4)
+def _path_zone_bounds(frame_w: int, frame_h: int) -> tuple[float, float, float]:
+    """
+    Pixel-space path-zone thresholds, specialized per resolution.
 
-    in_lane = config.PATH_ZONE_X_START <= center_ratio <= config.PATH_ZONE_X_END
-    near_ground = bottom_ratio >= config.PATH_ZONE_MIN_BOTTOM_Y_RATIO
-    return in_lane and near_ground
+    The camera resolution is fixed after open(), so the ratio products
+    are computed once; the per-frame filter then compares x1+x2 against
+    doubled bounds and y2 against an absolute row — no divisions.
+    """
+    return (
+        2.0 * config.PATH_ZONE_X_START * frame_w,
+        2.0 * config.PATH_ZONE_X_END * frame_w,
+        config.PATH_ZONE_MIN_BOTTOM_Y_RATIO * frame_h,
+    )
 
 
 def _preprocess_path_detections(detections: list[dict], frame_shape: tuple[int, int, int]) -> list[dict]:
@@ -204,32 +301,37 @@ def _preprocess_path_detections(detections: list[dict], frame_shape: tuple[int,
       2) keep only valid distance range
       3) sort nearest first
       4) merge duplicates/overlapping boxes
+
+    Filtering runs as vectorized NumPy masks; the nearest-first sort and
+    greedy IoU/center-distance merge run in the compiled
+    fastops.merge_keep kernel.
     """
-    filtered = [
-        d for d in detections
-        if _is_in_forward_path_zone(d["box"], frame_shape)
-        and config.DETECTION_MIN_DISTANCE_M <= d["distance"] <= config.DETECTION_MAX_DISTANCE_M
-    ]
-    filtered.sort(key=lambda d: d["distance"])
-
-    merged: list[dict] = []
-    for det in filtered:
-        det_center = _box_center(det["box"])
-        is_duplicate = False
-        for kept in merged:
-            kept_center = _box_center(kept["box"])
-            center_delta = abs(det_center[0] - kept_center[0]) + abs(det_center[1] - kept_center[1])
-            overlap = _box_iou(det["box"], kept["box"])
-            if (
-                overlap >= config.DETECTION_MERGE_IOU_THRESHOLD
-                or center_delta <= config.DETECTION_MERGE_CENTER_DISTANCE_PX
-            ):
-                is_duplicate = True
-                break
-        if not is_duplicate:
-            merged.append(det)
-
-    return merged
+    if not detections:
+        return []
+
+    boxes = np.asarray([d["box"] for d in detections], dtype=np.float32)
+    distances = np.asarray([d["distance"] for d in detections], dtype=np.float32)
+
+    x_start2, x_end2, y2_min = _path_zone_bounds(frame_shape[1], frame_shape[0])
+    center_x2 = boxes[:, 0] + boxes[:, 2]
+    in_path = (
+        (center_x2 >= x_start2)
+        & (center_x2 <= x_end2)
+        & (boxes[:, 3] >= y2_min)
+        & (distances >= config.DETECTION_MIN_DISTANCE_M)
+        & (distances <= config.DETECTION_MAX_DISTANCE_M)
+    )
+    idxs = np.flatnonzero(in_path)
+    if idxs.size == 0:
+        return []
+
+    kept = fastops.merge_keep(
+        np.ascontiguousarray(boxes[idxs]),
+        distances[idxs],
+        config.DETECTION_MERGE_IOU_THRESHOLD,
+        float(config.DETECTION_MERGE_CENTER_DISTANCE_PX),
+    )
+    return [detections[idxs[i]] for i in kept]
 
 
 # ─── WebSocket Handler ───────────────────────────────────────────
@@ -241,7 +343,7 @@ async def ws_handler(websocket):
 
     try:
         async for message in websocket:
-            data = json.loads(message)
+            data = _json_loads(message)
             msg_type = data.get("type", "")
 
             if msg_type == "trigger_phase2":
@@ -249,7 +351,7 @@ async def ws_handler(websocket):
                 state.phase2_requested = True
 
             elif msg_type == "ping":
-                await websocket.send(json.dumps(build_pong()))
+                await websocket.send(_json_dumps(build_pong()))
 
     except websockets.exceptions.ConnectionClosed:
         pass
@@ -258,15 +360,33 @@ async def ws_handler(websocket):
         print(f"[WS] Client disconnected: {client_addr}")
 
 
-async def broadcast(payload: dict):
-    """Send a JSON payload to all connected clients."""
+def broadcast(payload: dict) -> None:
+    """
+    Send a JSON payload to all connected clients.
+
+    Serializes once and fans the same text frame out through
+    websockets.broadcast, so cost stays O(1) in the client count and
+    per-client failures are handled by the library.
+    """
     if not state.clients:
         return
-    message = json.dumps(payload)
-    await asyncio.gather(
-        *(client.send(message) for client in state.clients),
-        return_exceptions=True,
-    )
+    websockets.broadcast(state.clients, _json_dumps(payload))
+
+
+@functools.lru_cache(maxsize=32)
+def _clear_payload(total_hazards: int) -> str:
+    """Pre-serialized no-alert payload, keyed only by the hazard count."""
+    return _json_dumps(build_phase1_payload(None, None, None, None, total_hazards))
+
+
+def broadcast_clear(total_hazards: int = 0) -> None:
+    """
+    Broadcast the "no active alert" heartbeat — the common steady-state
+    message — without rebuilding or reserializing the payload each tick.
+    """
+    if not state.clients:
+        return
+    websockets.broadcast(state.clients, _clear_payload(total_hazards))
 
 
 # ─── Phase 1 Loop ────────────────────────────────────────────────
@@ -281,56 +401,118 @@ async def phase1_loop():
     if debouncer is None:
         debouncer = HazardDebouncer()
 
+    # Hot-path locals: a LOAD_FAST per tick instead of
+    # LOAD_GLOBAL + LOAD_ATTR for constants read on every frame.
+    perf_counter = time.perf_counter
+    near_hazard_m = config.NEAR_HAZARD_DISTANCE_M
+    pass_increase_m = config.PASS_DISTANCE_INCREASE_M
+    match_tolerance_px = config.TARGET_MATCH_CENTER_TOLERANCE_PX
+    switch_confirm_frames = config.PHASE1_LOCK_SWITCH_CONFIRM_FRAMES
+    lost_frames_to_switch = config.TARGET_LOST_FRAMES_TO_SWITCH
+    batch_size = config.PHASE1_BATCH
+
     target_interval = 1.0 / config.PHASE1_TARGET_FPS
+    next_deadline = perf_counter()
     frames_processed = 0
-    start_time = time.perf_counter()
-    
+    start_time = perf_counter()
+
     # Phase 1 loop state
+    vis_interval = 1.0 / config.JUDGE_VIEW_FPS
+    last_vis_ts = 0.0
     last_detections = []
+    pending_frames: list[np.ndarray] = []        # micro-batch buffer (PHASE1_BATCH > 1)
+    pending_deadline = 0.0
     tracked_target: dict | None = None
     tracked_lost_frames = 0
     switch_candidate: dict | None = None
     switch_candidate_frames = 0
     
-    # Initialize Judge View (disabled in headless mode)
+    # Initialize Judge View (disabled in headless mode) — window creation
+    # and all drawing happen on the vis worker thread.
     if not HEADLESS_MODE:
-        cv2.namedWindow("Judge View", cv2.WINDOW_NORMAL)
-        cv2.resizeWindow("Judge View", 800, 600)
+        threading.Thread(target=_vis_worker, daemon=True, name="judge-view").start()
+
+    # Optional producer thread: capture + inference off the event loop
+    worker: InferenceWorker | None = None
+    if config.PHASE1_INFERENCE_THREAD:
+        worker = InferenceWorker(camera, reflex, asyncio.get_event_loop())
+        worker.start()
 
     try:
         while state.running:
-            loop_start = time.perf_counter()
+            loop_start = perf_counter()
 
             # ── Read frame (with skip logic inside CameraManager) ─
-            should_process, frame = camera.read()
+            if worker is not None:
+                should_process, frame, detections = await worker.next_frame()
+            else:
+                should_process, frame = camera.read()
+                detections = None
 
             if frame is None:
-                await asyncio.sleep(0.01)
+                if config.CAMERA_CAPTURE_THREAD:
+                    # Producer-thread mode: read() is non-blocking and the
+                    # slot refills at camera rate (~30ms), so a zero-sleep
+                    # retry would spin the loop at 100% CPU. A short nap
+                    # costs at most a frame-interval fraction of latency.
+                    await asyncio.sleep(0.002)
+                else:
+                    # Skipped frame (grab-only, no decode) or transient
+                    # camera error — grab() already blocked at camera
+                    # rate, so just yield and go back to draining.
+                    await asyncio.sleep(0)
                 continue
 
-            state.current_frame = frame
-            
             # ── Handle Phase 2 request (interrupts Phase 1 briefly) ─
             if state.phase2_requested:
                 state.phase2_requested = False
+                # Snapshot into the preallocated buffer; only pays the copy
+                # when Phase 2 is actually triggered, never per frame.
+                if state.phase2_frame is None or state.phase2_frame.shape != frame.shape:
+                    state.phase2_frame = np.empty_like(frame)
+                np.copyto(state.phase2_frame, frame)
                 debouncer.reset()          # clear cooldowns on mode switch
                 # Draw "Scanning..." overlay before switching
                 if not HEADLESS_MODE:
-                    cv2.putText(frame, "PHASE 2: SCANNING SCENE...", (50, 240), 
+                    cv2.putText(frame, "PHASE 2: SCANNING SCENE...", (50, 240),
                                cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 0, 255), 2)
-                    cv2.imshow("Judge View", frame)
-                    cv2.waitKey(1)
-                
-                await handle_phase2(frame)
+                    _show_judge_view(frame, [])
+
+                await handle_phase2(state.phase2_frame)
                 continue
 
             # ── Run Phase 1 detection (only on target frames) ────────
             if should_process:
                 try:
-                    detections = reflex.process_frame(frame)
+                    if detections is not None:
+                        pass                     # worker thread already ran inference
+                    elif reflex.supports_async:
+                        # Pipelined path: submit this frame, await the oldest
+                        # in-flight result so preprocessing of frame K+1
+                        # overlaps with inference of frame K.
+                        reflex.submit_frame(frame)
+                        detections = await reflex.next_detections()
+                    elif batch_size > 1:
+                        # Micro-batch path: accumulate frames, flush as one
+                        # predict() call when the batch fills or the frame
+                        # deadline passes. Alerts track the newest frame;
+                        # older frames still feed the tracker for continuity.
+                        if not pending_frames:
+                            pending_deadline = loop_start + target_interval
+                        pending_frames.append(frame)
+                        if (
+                            len(pending_frames) < batch_size
+                            and perf_counter() < pending_deadline
+                        ):
+                            continue
+                        batch_results = reflex.process_batch(pending_frames)
+                        pending_frames.clear()
+                        detections = batch_results[-1]
+                    else:
+                        detections = reflex.process_frame(frame)
                 except Exception as e:
                     print(f"[Phase1] Detector error: {e}")
-                    await broadcast(build_phase1_payload(None, None, None, None, 0))
+                    broadcast_clear(0)
                     await asyncio.sleep(0.02)
                     continue
 
@@ -338,6 +520,9 @@ async def phase1_loop():
                 frames_processed += 1
 
                 if detections:
+                    # One clock read per frame — shared by every debounce check below
+                    now = time.monotonic()
+
                     # Preprocess first so single-target tracking sees clean nearest objects.
                     path_detections = _preprocess_path_detections(detections, frame.shape)
 
@@ -346,7 +531,7 @@ async def phase1_loop():
                         tracked_lost_frames = 0
                         switch_candidate = None
                         switch_candidate_frames = 0
-                        await broadcast(build_phase1_payload(None, None, None, None, 0))
+                        broadcast_clear(0)
                         continue
 
                     # Target lock: keep current target until passed/lost,
@@ -355,7 +540,7 @@ async def phase1_loop():
                         selected = path_detections[0]
                         tracked_target = {
                             **selected,
-                            "was_near": selected["distance"] <= config.NEAR_HAZARD_DISTANCE_M,
+                            "was_near": selected["distance"] <= near_hazard_m,
                         }
                         tracked_lost_frames = 0
                     else:
@@ -364,27 +549,27 @@ async def phase1_loop():
                             tracked_lost_frames = 0
                             previous_distance = tracked_target["distance"]
                             was_near = tracked_target.get("was_near", False)
-                            is_near = matched["distance"] <= config.NEAR_HAZARD_DISTANCE_M
+                            is_near = matched["distance"] <= near_hazard_m
                             was_near = was_near or is_near
 
                             passed_current = (
                                 was_near
-                                and (matched["distance"] - previous_distance) >= config.PASS_DISTANCE_INCREASE_M
-                                and matched["distance"] > config.NEAR_HAZARD_DISTANCE_M
+                                and (matched["distance"] - previous_distance) >= pass_increase_m
+                                and matched["distance"] > near_hazard_m
                             )
 
                             if passed_current:
-                                next_target = _pick_next_target(path_detections, exclude_box=matched["box"])
+                                next_target = _pick_next_target(path_detections, exclude=matched)
                                 if next_target is not None:
                                     if switch_candidate is None:
                                         switch_candidate = next_target
                                         switch_candidate_frames = 1
                                     else:
                                         same_candidate = (
-                                            switch_candidate["hazard"] == next_target["hazard"]
-                                            and abs(_box_center(switch_candidate["box"])[0] - _box_center(next_target["box"])[0])
-                                            + abs(_box_center(switch_candidate["box"])[1] - _box_center(next_target["box"])[1])
-                                            <= config.TARGET_MATCH_CENTER_TOLERANCE_PX
+                                            switch_candidate["hazard_id"] == next_target["hazard_id"]
+                                            and abs(switch_candidate["cx"] - next_target["cx"])
+                                            + abs(switch_candidate["cy"] - next_target["cy"])
+                                            <= match_tolerance_px
                                         )
                                         if same_candidate:
                                             switch_candidate_frames += 1
@@ -392,10 +577,10 @@ async def phase1_loop():
                                             switch_candidate = next_target
                                             switch_candidate_frames = 1
 
-                                    if switch_candidate_frames >= config.PHASE1_LOCK_SWITCH_CONFIRM_FRAMES:
+                                    if switch_candidate_frames >= switch_confirm_frames:
                                         tracked_target = {
                                             **next_target,
-                                            "was_near": next_target["distance"] <= config.NEAR_HAZARD_DISTANCE_M,
+                                            "was_near": next_target["distance"] <= near_hazard_m,
                                         }
                                         switch_candidate = None
                                         switch_candidate_frames = 0
@@ -412,11 +597,11 @@ async def phase1_loop():
                                 switch_candidate_frames = 0
                         else:
                             tracked_lost_frames += 1
-                            if tracked_lost_frames >= config.TARGET_LOST_FRAMES_TO_SWITCH:
+                            if tracked_lost_frames >= lost_frames_to_switch:
                                 selected = path_detections[0]
                                 tracked_target = {
                                     **selected,
-                                    "was_near": selected["distance"] <= config.NEAR_HAZARD_DISTANCE_M,
+                                    "was_near": selected["distance"] <= near_hazard_m,
                                 }
                                 tracked_lost_frames = 0
                                 switch_candidate = None
@@ -425,7 +610,7 @@ async def phase1_loop():
                     active_target = tracked_target if tracked_target is not None else path_detections[0]
 
                     payload = None
-                    if debouncer.should_alert(active_target["hazard"], active_target["distance"]):
+                    if debouncer.should_alert(active_target["hazard_id"], active_target["distance"], now):
                         payload = build_phase1_payload(
                             hazard=active_target["hazard"],
                             direction=active_target["direction"],
@@ -437,7 +622,7 @@ async def phase1_loop():
                     # If we found an alert, broadcast it
                     if payload:
                         guidance_text = active_target.get("guidance", "")
-                        if payload["distance"] is not None and payload["distance"] <= config.NEAR_HAZARD_DISTANCE_M:
+                        if payload["distance"] is not None and payload["distance"] <= near_hazard_m:
                             msg = (
                                 f"Hazard near: {payload['hazard']} on your {payload['direction']}, "
                                 f"{payload['distance']} meters"
@@ -451,60 +636,60 @@ async def phase1_loop():
                             msg = f"{msg}. {guidance_text}."
                         print(f"[TTS-QUEUE] {msg}")
                         speak_alert(msg)
-                        await broadcast(payload)
+                        broadcast(payload)
                     else:
                         # Heartbeat if all hazards strictly debounced
-                        await broadcast(build_phase1_payload(None, None, None, None, len(path_detections)))
+                        broadcast_clear(len(path_detections))
                 else:
                     tracked_target = None
                     tracked_lost_frames = 0
                     switch_candidate = None
                     switch_candidate_frames = 0
                     # No hazards
-                    await broadcast(build_phase1_payload(None, None, None, None, 0))
+                    broadcast_clear(0)
 
             if not HEADLESS_MODE:
-                # ── DRAW JUDGE VIEW (On Every Frame) ─────────────────
-                vis_frame = frame.copy()
-                for det in last_detections:
-                    x1, y1, x2, y2 = det.get("box", [0, 0, 0, 0])
-                    label = f"{det['hazard']} {det['distance']}m"
-                    color = (0, 0, 255) # Red for danger
-
-                    cv2.rectangle(vis_frame, (x1, y1), (x2, y2), color, 2)
-                    (w, h), _ = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 1)
-                    cv2.rectangle(vis_frame, (x1, y1 - 20), (x1 + w, y1), color, -1)
-                    cv2.putText(vis_frame, label, (x1, y1 - 5), 
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1)
-
-                status_text = f"Phase 1: Active | Hazards: {len(last_detections)}"
-                cv2.putText(vis_frame, status_text, (10, 30), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
-
-                cv2.imshow("Judge View", vis_frame)
-                if cv2.waitKey(1) & 0xFF == ord('q'):
-                    state.running = False
-                    break
+                # ── JUDGE VIEW ───────────────────────────────────────
+                # Hand the frame to the vis worker; drawing + imshow +
+                # waitKey (and the 'q' quit key) all run on that thread.
+                # The frame is drawn on in place — the camera hands out a
+                # fresh buffer per retrieve() and Phase 2 snapshots into
+                # its own buffer above, so nothing else aliases it.
+                # Capped at JUDGE_VIEW_FPS: the debug window doesn't need
+                # every frame, and each displayed frame costs the worker
+                # an imshow + ~1ms waitKey message pump.
+                now_vis = perf_counter()
+                if now_vis - last_vis_ts >= vis_interval:
+                    last_vis_ts = now_vis
+                    _show_judge_view(frame, last_detections)
 
             # ── FPS counter (every 30 processed frames) ──────────────
             if frames_processed > 0 and frames_processed % 30 == 0:
-                elapsed = time.perf_counter() - start_time
+                elapsed = perf_counter() - start_time
                 fps = frames_processed / elapsed if elapsed > 0 else 0
                 print(f"[Phase1] Processing at {fps:.1f} FPS")
 
             # ── Frame‑rate throttle ──────────────────────────────────
-            # Only sleep if we processed a frame and need to maintain target FPS
-            # If we skipped, we loop immediately to drain the camera buffer
-            if should_process:
-                elapsed = time.perf_counter() - loop_start
-                sleep_time = target_interval - elapsed
-                if sleep_time > 0:
-                    await asyncio.sleep(sleep_time)
+            # Deadline-based pacing: each processed frame advances a fixed
+            # deadline, so a transient overrun (slow YOLO call) is caught
+            # up on the next frames instead of compounding into FPS drift.
+            # (The worker thread paces itself off the camera, no sleep needed.)
+            if should_process and worker is None:
+                next_deadline += target_interval
+                delay = next_deadline - perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                else:
+                    # More than a full frame behind — rebase rather than
+                    # sprinting through a backlog of stale deadlines.
+                    next_deadline = perf_counter()
 
     except KeyboardInterrupt:
         print("\n[Server] Shutting down...")
     finally:
-        # These cleanups are better handled in main() finally, 
+        if worker is not None:
+            worker.stop()
+        # These cleanups are better handled in main() finally,
         # but since we opened the window here, we can close it here or in main.
         # Ideally loop just returns and main handles cleanup.
         pass
@@ -518,24 +703,32 @@ async def handle_phase2(frame: np.ndarray):
     if context is None:
         context = ContextLayer()
 
+    # Coalesce trigger bursts: a run is already in flight and its
+    # broadcast will reach every client, so latest taps just ride along.
+    if state.phase2_inflight is not None and not state.phase2_inflight.done():
+        print("[Phase2] Trigger coalesced into in-flight description")
+        return
+
     print("[Phase2] Processing scene description...")
 
-    await broadcast(build_phase2_payload(status="processing"))
+    broadcast(build_phase2_payload(status="processing"))
 
-    # Run heavy model in a thread to avoid blocking the event loop
+    # Run the heavy model on the dedicated single worker so Phase-2 load
+    # is bounded to one inference at a time
     loop = asyncio.get_event_loop()
     try:
-        description = await loop.run_in_executor(
-            None, context.describe_scene, frame
+        state.phase2_inflight = loop.run_in_executor(
+            phase2_executor, context.describe_scene, frame
         )
+        description = await state.phase2_inflight
     except Exception as e:
         err = f"Phase 2 unavailable: {e}"
         print(f"[Phase2] Error: {e}")
-        await broadcast(build_phase2_payload(status="done", description=err))
+        broadcast(build_phase2_payload(status="done", description=err))
         return
 
     print(f"[Phase2] Description: {description[:80]}...")
-    await broadcast(build_phase2_payload(status="done", description=description))
+    broadcast(build_phase2_payload(status="done", description=description))
 
 
 # ─── Main Entry ──────────────────────────────────────────────────
@@ -552,6 +745,17 @@ async def main():
             camera = CameraManager()
         camera.open()
 
+        # Pin thread counts: torch, OpenCV and OpenMP each spawn their own
+        # pools and oversubscribe a laptop CPU, stealing cycles from the
+        # detection loop through context switching.
+        worker_threads = max(1, (os.cpu_count() or 2) // 2)
+        os.environ.setdefault("OMP_NUM_THREADS", str(worker_threads))
+        torch.set_num_threads(worker_threads)
+        cv2.setNumThreads(1)
+
+        # Pay first-inference JIT/autotune cost before going live
+        reflex.warmup()
+
     # Optional Phase-2 preload (disabled by default to protect Phase-1 latency)
     if config.PHASE2_PRELOAD_ON_START:
         global context
@@ -559,7 +763,7 @@ async def main():
             context = ContextLayer()
         loop = asyncio.get_event_loop()
         preload_future = asyncio.ensure_future(
-            loop.run_in_executor(None, context.load_model)
+            loop.run_in_executor(phase2_executor, context.load_model)
         )
 
         def _on_phase2_preload_done(fut: asyncio.Future):
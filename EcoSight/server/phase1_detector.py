@@ -0,0 +1,121 @@
+"""
+EcoSight Phase 1 — Detector Backends
+Supports:
+- ultralytics (default PyTorch YOLOv8 path, lives in phase1_reflex)
+- openvino (async pipelined inference via AsyncInferQueue)
+
+The OpenVINO backend keeps two infer requests in flight so frame N+1
+preprocessing and frame N postprocessing overlap with inference, instead
+of blocking the asyncio event loop for the full inference latency.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import cv2
+import numpy as np
+
+import config
+
+
+class OpenVINOAsyncDetector:
+    """
+    Async YOLOv8 detector driven by an OpenVINO AsyncInferQueue.
+
+    Usage (from the asyncio event loop):
+        detector.submit(frame)                  # non-blocking start_async
+        frame, boxes, meta = await detector.next_result()
+
+    The NMS callback runs on an OpenVINO worker thread and hands results
+    back to the event loop via loop.call_soon_threadsafe, so the loop
+    never stalls on inference.
+    """
+
+    def __init__(self, model_xml: str, confidence_threshold: float,
+                 hazard_classes: dict[int, str], imgsz: int):
+        from openvino.runtime import AsyncInferQueue, Core
+
+        self.confidence_threshold = confidence_threshold
+        self.hazard_classes = hazard_classes
+        self.imgsz = imgsz
+
+        core = Core()
+        compiled = core.compile_model(
+            model_xml, "CPU", {"PERFORMANCE_HINT": "LATENCY"}
+        )
+        self._queue = AsyncInferQueue(compiled, config.OPENVINO_INFER_REQUESTS)
+        self._queue.set_callback(self._on_result)
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._results: asyncio.Queue = asyncio.Queue()
+        self.inflight = 0
+
+    # ── Async pipeline ─────────────────────────────────────────
+    def submit(self, frame: np.ndarray) -> None:
+        """Start async inference on a frame (returns immediately)."""
+        if self._loop is None:
+            self._loop = asyncio.get_event_loop()
+        blob = self._preprocess(frame)
+        self.inflight += 1
+        self._queue.start_async({0: blob}, userdata=frame)
+
+    async def next_result(self) -> tuple[np.ndarray, list[list[int]], list[tuple[int, float]]]:
+        """Await the oldest in-flight result: (frame, boxes, [(cls_id, conf)])."""
+        result = await self._results.get()
+        self.inflight -= 1
+        return result
+
+    def _on_result(self, request, frame: np.ndarray) -> None:
+        """AsyncInferQueue callback — runs NMS off the event loop."""
+        output = request.get_output_tensor(0).data
+        boxes, meta = self._postprocess(output, frame.shape)
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(
+                self._results.put_nowait, (frame, boxes, meta)
+            )
+
+    # ── Pre/post-processing ────────────────────────────────────
+    def _preprocess(self, frame: np.ndarray) -> np.ndarray:
+        """BGR frame → (1,3,imgsz,imgsz) float32 RGB blob in [0,1]."""
+        resized = cv2.resize(frame, (self.imgsz, self.imgsz), interpolation=cv2.INTER_LINEAR)
+        rgb = cv2.cvtColor(resized, cv2.COLOR_BGR2RGB)
+        blob = rgb.astype(np.float32) / 255.0
+        return blob.transpose(2, 0, 1)[np.newaxis, ...]
+
+    def _postprocess(
+        self, output: np.ndarray, frame_shape: tuple[int, ...]
+    ) -> tuple[list[list[int]], list[tuple[int, float]]]:
+        """Decode YOLOv8 (1,84,N) output, filter hazards, run NMS."""
+        preds = output[0].T                       # (N, 4 + num_classes)
+        class_scores = preds[:, 4:]
+        cls_ids = class_scores.argmax(axis=1)
+        confs = class_scores[np.arange(len(cls_ids)), cls_ids]
+
+        keep = confs >= self.confidence_threshold
+        preds, cls_ids, confs = preds[keep], cls_ids[keep], confs[keep]
+        if len(preds) == 0:
+            return [], []
+
+        # cxcywh (model scale) → xyxy (frame scale)
+        scale_x = frame_shape[1] / self.imgsz
+        scale_y = frame_shape[0] / self.imgsz
+        cx, cy, w, h = preds[:, 0], preds[:, 1], preds[:, 2], preds[:, 3]
+        x1 = (cx - w / 2) * scale_x
+        y1 = (cy - h / 2) * scale_y
+        x2 = (cx + w / 2) * scale_x
+        y2 = (cy + h / 2) * scale_y
+
+        nms_boxes = np.stack([x1, y1, x2 - x1, y2 - y1], axis=1).tolist()
+        kept = cv2.dnn.NMSBoxes(nms_boxes, confs.tolist(),
+                                self.confidence_threshold, config.OPENVINO_NMS_IOU)
+
+        boxes: list[list[int]] = []
+        meta: list[tuple[int, float]] = []
+        for i in np.asarray(kept).flatten():
+            cls_id = int(cls_ids[i])
+            if cls_id not in self.hazard_classes:
+                continue
+            boxes.append([int(x1[i]), int(y1[i]), int(x2[i]), int(y2[i])])
+            meta.append((cls_id, float(confs[i])))
+        return boxes, meta
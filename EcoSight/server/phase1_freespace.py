@@ -6,8 +6,13 @@ Current backend:
 
 from __future__ import annotations
 
+import numpy as np
+
 import config
 
+# Fixed lane ordering for the (3,) score vector.
+LANE_IDX = {"left": 0, "center": 1, "right": 2}
+
 
 class FreeSpaceEstimator:
     def __init__(self, backend: str):
@@ -15,44 +20,58 @@ class FreeSpaceEstimator:
         if self.backend in ("bisenetv2", "fast_scnn"):
             print(f"[Phase1][FreeSpace] {self.backend} requested; using heuristic backend currently")
             self.backend = "heuristic"
+        # Lane geometry cache — the resolution is fixed after camera open,
+        # so the bounds/areas are rebuilt only if the shape ever changes.
+        self._cached_shape: tuple[int, int] | None = None
+        self._lane_x1: np.ndarray | None = None
+        self._lane_x2: np.ndarray | None = None
+        self._lane_area: np.ndarray | None = None
+        self._y_min = 0
+        self._y_max = 0
 
-    def lane_scores(self, frame_shape: tuple[int, int, int], detections: list[dict]) -> dict[str, float]:
+    def _bind_shape(self, height: int, width: int) -> None:
+        self._y_min = int(height * config.GUIDANCE_LOWER_FRAME_START_RATIO)
+        self._y_max = height
+        self._lane_x1 = np.array(
+            [0, int(width * config.LEFT_ZONE_END), int(width * config.RIGHT_ZONE_START)],
+            dtype=np.float64,
+        )
+        self._lane_x2 = np.array(
+            [int(width * config.LEFT_ZONE_END), int(width * config.RIGHT_ZONE_START), width],
+            dtype=np.float64,
+        )
+        lane_height = max(1, self._y_max - self._y_min)
+        self._lane_area = np.maximum(1.0, (self._lane_x2 - self._lane_x1) * lane_height)
+        self._cached_shape = (height, width)
+
+    def lane_scores(self, frame_shape: tuple[int, int, int], detections) -> np.ndarray:
         """
-        Returns free-space score per lane in [0,1]: left/center/right.
-        Higher = safer/more open.
+        Returns a (3,) free-space score vector in [0,1] ordered
+        [left, center, right] (see LANE_IDX). Higher = safer/more open.
+
+        The detections × lanes occupancy sum runs as one broadcasted
+        NumPy intersection instead of a Python double-loop. Accepts
+        either an (K,4) box array or a list of detection dicts.
         """
         height, width = frame_shape[0], frame_shape[1]
-        y_min = int(height * config.GUIDANCE_LOWER_FRAME_START_RATIO)
-        y_max = height
-
-        lane_bounds = {
-            "left": (0, int(width * config.LEFT_ZONE_END)),
-            "center": (int(width * config.LEFT_ZONE_END), int(width * config.RIGHT_ZONE_START)),
-            "right": (int(width * config.RIGHT_ZONE_START), width),
-        }
-
-        occupied = {"left": 0.0, "center": 0.0, "right": 0.0}
-
-        for det in detections:
-            x1, y1, x2, y2 = det["box"]
-            y1c = max(y_min, y1)
-            y2c = min(y_max, y2)
-            if y2c <= y1c:
-                continue
-
-            for lane, (lx1, lx2) in lane_bounds.items():
-                ix1 = max(x1, lx1)
-                ix2 = min(x2, lx2)
-                if ix2 <= ix1:
-                    continue
-                area = float((ix2 - ix1) * (y2c - y1c))
-                occupied[lane] += area
-
-        scores: dict[str, float] = {}
-        lane_height = max(1, y_max - y_min)
-        for lane, (lx1, lx2) in lane_bounds.items():
-            lane_area = max(1.0, float((lx2 - lx1) * lane_height))
-            occ_ratio = min(1.0, occupied[lane] / lane_area)
-            scores[lane] = max(0.0, 1.0 - occ_ratio)
-
-        return scores
+        if self._cached_shape != (height, width):
+            self._bind_shape(height, width)
+
+        if len(detections):
+            if isinstance(detections, np.ndarray):
+                boxes = detections.astype(np.float64, copy=False).reshape(-1, 4)
+            else:
+                boxes = np.asarray([d["box"] for d in detections], dtype=np.float64)
+            y1c = np.maximum(boxes[:, 1], self._y_min)
+            y2c = np.minimum(boxes[:, 3], self._y_max)
+            h = np.maximum(0.0, y2c - y1c)
+
+            # (K,3) intersection widths against the three lane columns
+            ix1 = np.maximum(boxes[:, 0:1], self._lane_x1)
+            ix2 = np.minimum(boxes[:, 2:3], self._lane_x2)
+            w = np.maximum(0.0, ix2 - ix1)
+            occupied = (w * h[:, None]).sum(axis=0)
+        else:
+            occupied = np.zeros(3)
+
+        return np.maximum(0.0, 1.0 - np.minimum(1.0, occupied / self._lane_area))
@@ -5,24 +5,39 @@ Chooses safer move lane based on hazard direction + free-space map.
 
 from __future__ import annotations
 
+import numpy as np
+
 import config
 
+# Lane preference per hazard direction as indices into the (3,) score
+# vector ([left, center, right] — see phase1_freespace.LANE_IDX), plus
+# the three possible phrases, all fixed at module load. choose_move is
+# then a dict lookup and a 3-way scan over array scalars — no list
+# building, dict hashing or f-string per call.
+_LANES = ("left", "center", "right")
+_ORDER_IDX: dict[str, tuple[int, int, int]] = {
+    "left": (2, 1, 0),     # right, center, left
+    "right": (0, 1, 2),    # left, center, right
+    "center": (0, 2, 1),   # left, right, center
+}
+_PHRASES: dict[str, str] = {
+    lane: f"move {config.GUIDANCE_MOVE_WORD} {lane}" for lane in _LANES
+}
 
-class PathGuidance:
-    @staticmethod
-    def _lane_order_away_from_hazard(hazard_direction: str) -> list[str]:
-        if hazard_direction == "left":
-            return ["right", "center", "left"]
-        if hazard_direction == "right":
-            return ["left", "center", "right"]
-        return ["left", "right", "center"]
 
-    def choose_move(self, hazard_direction: str, lane_scores: dict[str, float]) -> tuple[str, str]:
+class PathGuidance:
+    def choose_move(self, hazard_direction: str, lane_scores: np.ndarray) -> tuple[str, str]:
         """
         Returns tuple: (move_lane, phrase)
         Example: ('left', 'move slightly left')
         """
-        order = self._lane_order_away_from_hazard(hazard_direction)
-        best_lane = max(order, key=lambda lane: lane_scores.get(lane, 0.0))
-        phrase = f"move {config.GUIDANCE_MOVE_WORD} {best_lane}"
-        return best_lane, phrase
+        order = _ORDER_IDX.get(hazard_direction, _ORDER_IDX["center"])
+        best = order[0]
+        best_score = lane_scores[best]
+        for idx in order[1:]:
+            score = lane_scores[idx]
+            if score > best_score:
+                best_score = score
+                best = idx
+        best_lane = _LANES[best]
+        return best_lane, _PHRASES[best_lane]
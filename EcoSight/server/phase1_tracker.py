@@ -8,81 +8,95 @@ Backends:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import numpy as np
 
 import config
-
-
-@dataclass
-class _TrackItem:
-    track_id: int
-    center_x: float
-    center_y: float
-    age: int
+import fastops
 
 
 class TrackManager:
+    """
+    Track state lives in struct-of-arrays form — parallel id/centre/age
+    arrays instead of per-track heap objects — so aging and stale
+    pruning are whole-array operations and matching reads one
+    contiguous (N,2) centre block.
+    """
+
     def __init__(self, backend: str):
         self.backend = backend
         self._next_id = 1
-        self._tracks: dict[int, _TrackItem] = {}
+        self._ids = np.empty(0, np.int32)
+        self._centers = np.empty((0, 2), np.float32)
+        self._ages = np.empty(0, np.int32)
 
         if self.backend == "ocsort":
             print("[Phase1][Track] OC-SORT backend requested; using simple fallback currently")
             self.backend = "simple"
 
-    @staticmethod
-    def _center(box: list[int]) -> tuple[float, float]:
-        x1, y1, x2, y2 = box
-        return ((x1 + x2) / 2.0, (y1 + y2) / 2.0)
-
-    def assign_ids(self, detections: list[dict]) -> list[dict]:
+    def assign_ids_from_centers(self, centers: np.ndarray) -> np.ndarray:
         """
-        Assign stable track_id to detections (simple fallback tracker).
+        Assign a stable track id per detection centre (simple tracker).
+
+        The detection × track L1 cost matrix is computed in one NumPy
+        broadcast, then the greedy nearest-unused-track assignment runs
+        in the compiled fastops.greedy_match kernel. Takes an (N,2)
+        float array, returns an (N,) int32 id array.
         """
-        if not detections:
-            self._age_tracks()
-            return detections
-
-        used_track_ids: set[int] = set()
-
-        for det in detections:
-            cx, cy = self._center(det["box"])
-            best_id = None
-            best_delta = float("inf")
-
-            for tid, track in self._tracks.items():
-                if tid in used_track_ids:
-                    continue
-                delta = abs(cx - track.center_x) + abs(cy - track.center_y)
-                if delta < best_delta:
-                    best_delta = delta
-                    best_id = tid
-
-            if best_id is not None and best_delta <= config.TRACK_MATCH_MAX_CENTER_DELTA_PX:
-                track = self._tracks[best_id]
-                track.center_x = cx
-                track.center_y = cy
-                track.age = 0
-                det["track_id"] = best_id
-                used_track_ids.add(best_id)
+        n_tracks = len(self._ids)
+        n_det = len(centers)
+        if n_det == 0:
+            self._age_tracks(np.zeros(n_tracks, bool))
+            return np.empty(0, np.int32)
+
+        centers = np.asarray(centers, np.float32).reshape(-1, 2)
+        matched = np.zeros(n_tracks, bool)
+        match_idx = None
+        if n_tracks:
+            cost = np.abs(centers[:, None, :] - self._centers[None, :, :]).sum(axis=2)
+            match_idx = fastops.greedy_match(
+                cost, float(config.TRACK_MATCH_MAX_CENTER_DELTA_PX)
+            )
+            matched[match_idx[match_idx >= 0]] = True
+
+        out_ids = np.empty(n_det, np.int32)
+        new_mask = np.zeros(n_det, bool)
+
+        for det_idx in range(n_det):
+            best_idx = -1 if match_idx is None else match_idx[det_idx]
+
+            if best_idx >= 0:
+                self._centers[best_idx] = centers[det_idx]
+                out_ids[det_idx] = self._ids[best_idx]
             else:
-                tid = self._next_id
+                out_ids[det_idx] = self._next_id
                 self._next_id += 1
-                self._tracks[tid] = _TrackItem(track_id=tid, center_x=cx, center_y=cy, age=0)
-                det["track_id"] = tid
-                used_track_ids.add(tid)
+                new_mask[det_idx] = True
 
-        self._age_tracks(except_ids=used_track_ids)
+        self._age_tracks(matched)
+        if new_mask.any():
+            self._ids = np.concatenate([self._ids, out_ids[new_mask]])
+            self._centers = np.concatenate([self._centers, centers[new_mask]])
+            self._ages = np.concatenate(
+                [self._ages, np.zeros(int(new_mask.sum()), np.int32)]
+            )
+        return out_ids
+
+    def assign_ids(self, detections: list[dict]) -> list[dict]:
+        """Dict-based wrapper around assign_ids_from_centers."""
+        centers = np.array([(d["cx"], d["cy"]) for d in detections], np.float32)
+        ids = self.assign_ids_from_centers(centers.reshape(-1, 2))
+        for det, tid in zip(detections, ids):
+            det["track_id"] = int(tid)
         return detections
 
-    def _age_tracks(self, except_ids: set[int] | None = None) -> None:
-        except_ids = except_ids or set()
-        stale_ids: list[int] = []
-        for tid, track in self._tracks.items():
-            if tid not in except_ids:
-                track.age += 1
-            if track.age > config.TRACK_MAX_AGE_FRAMES:
-                stale_ids.append(tid)
-        for tid in stale_ids:
-            self._tracks.pop(tid, None)
+    def _age_tracks(self, matched: np.ndarray) -> None:
+        """Age unmatched tracks and prune the stale ones — all mask ops."""
+        if not len(self._ids):
+            return
+        self._ages[~matched] += 1
+        self._ages[matched] = 0
+        keep = self._ages <= config.TRACK_MAX_AGE_FRAMES
+        if not keep.all():
+            self._ids = self._ids[keep]
+            self._centers = self._centers[keep]
+            self._ages = self._ages[keep]
@@ -0,0 +1,69 @@
+"""
+EcoSight Phase 1 — Inference Worker Thread
+Runs the blocking C calls (cv2.VideoCapture.read + YOLO inference) on a
+dedicated producer thread so the asyncio event loop never stalls on
+them and websocket sends stay responsive regardless of inference time.
+
+Results are handed over through a size-1 slot: a stale frame waiting in
+the slot is dropped when a fresher one arrives, mirroring the
+CAP_PROP_BUFFERSIZE=1 philosophy used by CameraManager.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import numpy as np
+
+
+class InferenceWorker(threading.Thread):
+    """Producer thread: capture + detect, publish freshest result to asyncio."""
+
+    def __init__(self, camera, reflex, loop: asyncio.AbstractEventLoop):
+        super().__init__(daemon=True, name="phase1-inference")
+        self.camera = camera
+        self.reflex = reflex
+        self._loop = loop
+        self._slot: asyncio.Queue = asyncio.Queue(maxsize=1)
+        self._running = True
+        self._last_detections: list[dict] = []
+
+    # ── Thread side ────────────────────────────────────────────
+    def run(self) -> None:
+        while self._running:
+            should_process, frame = self.camera.read()
+            if frame is None:
+                # Skipped frame (grab-only, no decode) or transient camera
+                # error — grab() already paced us, keep draining.
+                time.sleep(0.001)
+                continue
+
+            detections = self._last_detections
+            if should_process:
+                try:
+                    detections = self.reflex.process_frame(frame)
+                    self._last_detections = detections
+                except Exception as e:
+                    print(f"[Phase1] Detector error: {e}")
+                    detections = []
+
+            self._loop.call_soon_threadsafe(
+                self._publish, should_process, frame, detections
+            )
+
+    def _publish(self, should_process: bool, frame: np.ndarray, detections: list[dict]) -> None:
+        # Size-1 slot — drop the stale result so the consumer always
+        # sees the freshest frame instead of queueing up latency.
+        if self._slot.full():
+            self._slot.get_nowait()
+        self._slot.put_nowait((should_process, frame, detections))
+
+    # ── Event-loop side ────────────────────────────────────────
+    async def next_frame(self) -> tuple[bool, np.ndarray, list[dict]]:
+        """Await the freshest (should_process, frame, detections) triple."""
+        return await self._slot.get()
+
+    def stop(self) -> None:
+        self._running = False
@@ -52,12 +52,19 @@ def build_phase1_payload(
     }
 
 
+_PHASE2_STATUSES = frozenset(("processing", "done"))
+
+# Pong never varies — one shared dict, callers only serialize it.
+_PONG = {"type": "pong"}
+
+
 def build_phase2_payload(
     status: str,
     description: str | None = None,
 ) -> dict:
     """Build a validated Phase 2 scene description payload."""
-    assert status in ("processing", "done"), f"Invalid phase2 status: {status}"
+    if status not in _PHASE2_STATUSES:
+        raise ValueError(f"Invalid phase2 status: {status}")
     return {
         "type": "phase_2",
         "status": status,
@@ -66,4 +73,4 @@ def build_phase2_payload(
 
 
 def build_pong() -> dict:
-    return {"type": "pong"}
+    return _PONG
@@ -9,133 +9,144 @@ Replaces OpenCV judge window with a web UI:
 
 from __future__ import annotations
 
+import collections
+import functools
+import itertools
 import json
+import queue
+import threading
 import time
 import os
 import subprocess
 import sys
 import atexit
-import base64
 from typing import Any
 
 import cv2
 import numpy as np
 import streamlit as st
 
+# libjpeg-turbo JPEG encoder — SIMD-accelerated and takes RGB directly,
+# so the per-tick RGB→BGR pass for cv2.imencode disappears. Optional;
+# the OpenCV codec remains as fallback.
+try:
+    import simplejpeg
+except ImportError:
+    simplejpeg = None
+
 import config
+import fastops
 from camera import CameraManager
 from debounce import HazardDebouncer
 from phase1_reflex import ReflexLayer
 from phase2_context import ContextLayer
 
 
-def _box_center(box: list[int]) -> tuple[float, float]:
-    x1, y1, x2, y2 = box
-    return ((x1 + x2) / 2.0, (y1 + y2) / 2.0)
-
-
-def _box_iou(box_a: list[int], box_b: list[int]) -> float:
-    ax1, ay1, ax2, ay2 = box_a
-    bx1, by1, bx2, by2 = box_b
-
-    inter_x1 = max(ax1, bx1)
-    inter_y1 = max(ay1, by1)
-    inter_x2 = min(ax2, bx2)
-    inter_y2 = min(ay2, by2)
-
-    inter_w = max(0, inter_x2 - inter_x1)
-    inter_h = max(0, inter_y2 - inter_y1)
-    inter_area = inter_w * inter_h
-
-    area_a = max(0, ax2 - ax1) * max(0, ay2 - ay1)
-    area_b = max(0, bx2 - bx1) * max(0, by2 - by1)
-    union = area_a + area_b - inter_area
-    if union <= 0:
-        return 0.0
-    return inter_area / union
-
-
-def _is_in_forward_path_zone(box: list[int], frame_shape: tuple[int, int, int]) -> bool:
-    frame_h, frame_w = frame_shape[0], frame_shape[1]
-    x1, y1, x2, y2 = box
-    center_x = (x1 + x2) / 2.0
-    center_ratio = center_x / max(frame_w, 1)
-    bottom_ratio = y2 / max(frame_h, 1)
-
-    in_lane = config.PATH_ZONE_X_START <= center_ratio <= config.PATH_ZONE_X_END
-    near_ground = bottom_ratio >= config.PATH_ZONE_MIN_BOTTOM_Y_RATIO
-    return in_lane and near_ground
-
-
 def _preprocess_path_detections(detections: list[dict], frame_shape: tuple[int, int, int]) -> list[dict]:
-    filtered = [
-        d
-        for d in detections
-        if _is_in_forward_path_zone(d["box"], frame_shape)
-        and config.DETECTION_MIN_DISTANCE_M <= d["distance"] <= config.DETECTION_MAX_DISTANCE_M
-    ]
-    filtered.sort(key=lambda d: d["distance"])
-
-    merged: list[dict] = []
-    for det in filtered:
-        det_center = _box_center(det["box"])
-        duplicate = False
-        for kept in merged:
-            kept_center = _box_center(kept["box"])
-            center_delta = abs(det_center[0] - kept_center[0]) + abs(det_center[1] - kept_center[1])
-            overlap = _box_iou(det["box"], kept["box"])
-            if (
-                overlap >= config.DETECTION_MERGE_IOU_THRESHOLD
-                or center_delta <= config.DETECTION_MERGE_CENTER_DISTANCE_PX
-            ):
-                duplicate = True
-                break
-        if not duplicate:
-            merged.append(det)
-
-    return merged
+    # Zone/distance filter and nearest-first duplicate merge run fused
+    # in one compiled kernel call — no Python per-pair IoU loop and no
+    # intermediate mask arrays.
+    if not detections:
+        return []
+
+    boxes = np.asarray([d["box"] for d in detections], dtype=np.float32)
+    distances = np.asarray([d["distance"] for d in detections], dtype=np.float32)
+
+    kept = fastops.path_merge_keep(
+        boxes,
+        distances,
+        float(frame_shape[1]),
+        float(frame_shape[0]),
+        config.PATH_ZONE_X_START,
+        config.PATH_ZONE_X_END,
+        config.PATH_ZONE_MIN_BOTTOM_Y_RATIO,
+        config.DETECTION_MIN_DISTANCE_M,
+        config.DETECTION_MAX_DISTANCE_M,
+        config.DETECTION_MERGE_IOU_THRESHOLD,
+        float(config.DETECTION_MERGE_CENTER_DISTANCE_PX),
+    )
+    return [detections[i] for i in kept]
 
 
 def _match_target_detection(detections: list[dict], tracked: dict) -> dict | None:
+    # Centres are precomputed once per detection by the Reflex layer
+    # ("cx"/"cy"), so matching is dict reads instead of re-deriving
+    # (x1+x2)/2 several times per candidate.
     if not tracked:
         return None
 
-    tracked_center = _box_center(tracked["box"])
-    candidates = [d for d in detections if d["hazard"] == tracked["hazard"]]
+    tracked_cx, tracked_cy = tracked["cx"], tracked["cy"]
+    candidates = [d for d in detections if d["hazard_id"] == tracked["hazard_id"]]
     if not candidates:
         return None
 
     best = min(
         candidates,
-        key=lambda d: abs(_box_center(d["box"])[0] - tracked_center[0]) + abs(_box_center(d["box"])[1] - tracked_center[1]),
+        key=lambda d: abs(d["cx"] - tracked_cx) + abs(d["cy"] - tracked_cy),
     )
-    best_center = _box_center(best["box"])
-    center_delta = abs(best_center[0] - tracked_center[0]) + abs(best_center[1] - tracked_center[1])
+    center_delta = abs(best["cx"] - tracked_cx) + abs(best["cy"] - tracked_cy)
 
     if center_delta > config.TARGET_MATCH_CENTER_TOLERANCE_PX:
         return None
     return best
 
 
-def _pick_next_target(detections: list[dict], exclude_box: list[int] | None = None) -> dict | None:
+def _pick_next_target(detections: list[dict], exclude: dict | None = None) -> dict | None:
     if not detections:
         return None
-    if exclude_box is None:
+    if exclude is None:
         return detections[0]
 
-    ex_cx, ex_cy = _box_center(exclude_box)
+    ex_cx, ex_cy = exclude["cx"], exclude["cy"]
     for det in detections:
-        cx, cy = _box_center(det["box"])
-        if abs(cx - ex_cx) + abs(cy - ex_cy) > config.TARGET_MATCH_CENTER_TOLERANCE_PX:
+        if abs(det["cx"] - ex_cx) + abs(det["cy"] - ex_cy) > config.TARGET_MATCH_CENTER_TOLERANCE_PX:
             return det
     return None
 
 
+def _put_latest(q: queue.Queue, item: Any) -> None:
+    """Put into a size-1 slot, replacing any stale undrained item."""
+    try:
+        q.put_nowait(item)
+    except queue.Full:
+        try:
+            q.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            q.put_nowait(item)
+        except queue.Full:
+            pass
+
+
+def _inference_worker(reflex: ReflexLayer, in_q: queue.Queue, out_q: queue.Queue) -> None:
+    """
+    Detection off the render path: consume the freshest submitted frame,
+    publish detections through a size-1 slot — the queue.Queue analogue
+    of the server loop's InferenceWorker, since there's no asyncio loop
+    here to hand results back to.
+    """
+    while True:
+        frame = in_q.get()
+        if frame is None:
+            break
+        try:
+            detections = reflex.process_frame(frame)
+        except Exception as e:
+            print(f"[Phase1] Detector error: {e}")
+            detections = []
+        _put_latest(out_q, detections)
+
+
 def _init_state() -> None:
     simple_defaults: dict[str, Any] = {
         "running": False,
         "camera_opened": False,
         "last_detections": [],
+        "last_path_detections": [],
+        "jpeg_quality": 65,
+        "frame_latency_ms": 0.0,
+        "last_frame_ts": 0.0,
         "latest_frame": None,
         "stream_frame_counter": 0,
         "tracked_target": None,
@@ -146,7 +157,12 @@ def _init_state() -> None:
         "phase2_description": "",
         "phase2_request": False,
         "last_tts_msg": "",
-        "alert_log": [],
+        # Bounded deque: appendleft is O(1) and old entries fall off the
+        # end, vs. the old list insert(0)+slice copy per alert.
+        "alert_log": collections.deque(maxlen=40),
+        # Monotonic append counter — the table dirty-flag keys off this,
+        # since len() pins at maxlen and alert text can repeat.
+        "alert_seq": 0,
         "last_error": "",
         "backend_proc": None,
         "backend_running": False,
@@ -163,6 +179,17 @@ def _init_state() -> None:
         st.session_state["debouncer"] = HazardDebouncer()
     if "context" not in st.session_state:
         st.session_state["context"] = None
+    if "infer_in_q" not in st.session_state:
+        in_q: queue.Queue = queue.Queue(maxsize=1)
+        out_q: queue.Queue = queue.Queue(maxsize=1)
+        threading.Thread(
+            target=_inference_worker,
+            args=(st.session_state["reflex"], in_q, out_q),
+            daemon=True,
+            name="dashboard-inference",
+        ).start()
+        st.session_state["infer_in_q"] = in_q
+        st.session_state["infer_out_q"] = out_q
 
 
 def _get_context() -> ContextLayer:
@@ -189,6 +216,10 @@ def _start_backend() -> None:
         env=env,
         stdout=subprocess.DEVNULL,
         stderr=subprocess.DEVNULL,
+        # Lets CPython take its posix_spawn fast path instead of
+        # fork+exec — no page-table copy of this (torch-sized) process
+        # on launch. The backend ignores inherited fds anyway.
+        close_fds=False,
     )
     st.session_state["backend_proc"] = backend
     st.session_state["backend_running"] = True
@@ -220,12 +251,32 @@ def _cleanup_backend() -> None:
 atexit.register(_cleanup_backend)
 
 
+@functools.lru_cache(maxsize=256)
+def _label_size(label: str) -> tuple[int, int]:
+    """Memoized getTextSize — labels repeat heavily across frames."""
+    (w, h), _ = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.55, 1)
+    return w, h
+
+
+@functools.lru_cache(maxsize=4)
+def _zone_draw_coords(height: int, width: int) -> tuple[int, int, int]:
+    """Path-zone overlay pixel coords — pure function of the frame shape."""
+    return (
+        int(width * config.PATH_ZONE_X_START),
+        int(width * config.PATH_ZONE_X_END),
+        int(height * config.PATH_ZONE_MIN_BOTTOM_Y_RATIO),
+    )
+
+
 def _draw_frame(frame: np.ndarray, detections: list[dict], path_detections: list[dict], active_target: dict | None) -> np.ndarray:
-    vis = frame.copy()
+    # Draws in place — the caller owns this frame (latest_frame was
+    # copied upstream), so the full-frame memcpy per tick is gone.
+    vis = frame
 
     path_keys = {
         (d["box"][0], d["box"][1], d["box"][2], d["box"][3]) for d in path_detections
     }
+    font = cv2.FONT_HERSHEY_SIMPLEX
 
     for det in detections:
         x1, y1, x2, y2 = det["box"]
@@ -247,25 +298,55 @@ def _draw_frame(frame: np.ndarray, detections: list[dict], path_detections: list
             label += f" id:{det['track_id']}"
 
         cv2.rectangle(vis, (x1, y1), (x2, y2), color, thickness)
-        (w, h), _ = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.55, 1)
+        w, h = _label_size(label)
         cv2.rectangle(vis, (x1, max(0, y1 - 20)), (x1 + w, y1), color, -1)
-        cv2.putText(vis, label, (x1, y1 - 5), cv2.FONT_HERSHEY_SIMPLEX, 0.55, (255, 255, 255), 1)
+        cv2.putText(vis, label, (x1, y1 - 5), font, 0.55, (255, 255, 255), 1)
 
     h, w = vis.shape[:2]
-    lx1 = int(w * config.PATH_ZONE_X_START)
-    lx2 = int(w * config.PATH_ZONE_X_END)
-    ly = int(h * config.PATH_ZONE_MIN_BOTTOM_Y_RATIO)
+    lx1, lx2, ly = _zone_draw_coords(h, w)
     cv2.rectangle(vis, (lx1, ly), (lx2, h - 1), (0, 255, 0), 2)
 
     return vis
 
 
-def _frame_to_data_uri(frame_rgb: np.ndarray, quality: int = 65) -> str:
-    ok, buf = cv2.imencode(".jpg", cv2.cvtColor(frame_rgb, cv2.COLOR_RGB2BGR), [int(cv2.IMWRITE_JPEG_QUALITY), quality])
+def _encode_jpeg(frame_rgb: np.ndarray, quality: int) -> bytes | None:
+    if simplejpeg is not None:
+        return simplejpeg.encode_jpeg(
+            np.ascontiguousarray(frame_rgb),
+            quality=quality,
+            colorspace="RGB",
+            fastdct=True,
+        )
+    # Live preview wants speed over size: no second Huffman-stats pass
+    # (OPTIMIZE) and no progressive scan ordering, stated explicitly so
+    # a codec-default change can't silently slow the loop down.
+    ok, buf = cv2.imencode(
+        ".jpg",
+        cv2.cvtColor(frame_rgb, cv2.COLOR_RGB2BGR),
+        [
+            int(cv2.IMWRITE_JPEG_QUALITY), quality,
+            int(cv2.IMWRITE_JPEG_OPTIMIZE), 0,
+            int(cv2.IMWRITE_JPEG_PROGRESSIVE), 0,
+        ],
+    )
     if not ok:
-        return ""
-    b64 = base64.b64encode(buf.tobytes()).decode("ascii")
-    return f"data:image/jpeg;base64,{b64}"
+        return None
+    return buf.tobytes()
+
+
+def _adapt_jpeg_quality(latency_ms: float, budget_ms: float) -> None:
+    """
+    Step JPEG quality down when encode+send blows the refresh budget,
+    back up when there's comfortable headroom. Rolling EMA smooths out
+    single slow ticks.
+    """
+    rolling = 0.8 * st.session_state["frame_latency_ms"] + 0.2 * latency_ms
+    st.session_state["frame_latency_ms"] = rolling
+    quality = st.session_state["jpeg_quality"]
+    if rolling > budget_ms and quality > 35:
+        st.session_state["jpeg_quality"] = quality - 5
+    elif rolling < budget_ms * 0.5 and quality < 65:
+        st.session_state["jpeg_quality"] = quality + 5
 
 
 def _maybe_speak_browser(text: str, enabled: bool) -> None:
@@ -306,13 +387,14 @@ def _compute_active_target(path_detections: list[dict]) -> dict | None:
         return None
 
     if tracked_target is None:
+        # The selected dict was freshly built this frame and nothing
+        # else reads was_near, so set the flag in place instead of
+        # spread-copying every field into a new dict.
         selected = path_detections[0]
-        st.session_state["tracked_target"] = {
-            **selected,
-            "was_near": selected["distance"] <= config.NEAR_HAZARD_DISTANCE_M,
-        }
+        selected["was_near"] = selected["distance"] <= config.NEAR_HAZARD_DISTANCE_M
+        st.session_state["tracked_target"] = selected
         st.session_state["tracked_lost_frames"] = 0
-        return st.session_state["tracked_target"]
+        return selected
 
     matched = _match_target_detection(path_detections, tracked_target)
     if matched is not None:
@@ -329,16 +411,16 @@ def _compute_active_target(path_detections: list[dict]) -> dict | None:
         )
 
         if passed_current:
-            next_target = _pick_next_target(path_detections, exclude_box=matched["box"])
+            next_target = _pick_next_target(path_detections, exclude=matched)
             if next_target is not None:
                 if switch_candidate is None:
                     switch_candidate = next_target
                     switch_candidate_frames = 1
                 else:
                     same_candidate = (
-                        switch_candidate["hazard"] == next_target["hazard"]
-                        and abs(_box_center(switch_candidate["box"])[0] - _box_center(next_target["box"])[0])
-                        + abs(_box_center(switch_candidate["box"])[1] - _box_center(next_target["box"])[1])
+                        switch_candidate["hazard_id"] == next_target["hazard_id"]
+                        and abs(switch_candidate["cx"] - next_target["cx"])
+                        + abs(switch_candidate["cy"] - next_target["cy"])
                         <= config.TARGET_MATCH_CENTER_TOLERANCE_PX
                     )
                     if same_candidate:
@@ -348,10 +430,8 @@ def _compute_active_target(path_detections: list[dict]) -> dict | None:
                         switch_candidate_frames = 1
 
                 if switch_candidate_frames >= config.PHASE1_LOCK_SWITCH_CONFIRM_FRAMES:
-                    st.session_state["tracked_target"] = {
-                        **next_target,
-                        "was_near": next_target["distance"] <= config.NEAR_HAZARD_DISTANCE_M,
-                    }
+                    next_target["was_near"] = next_target["distance"] <= config.NEAR_HAZARD_DISTANCE_M
+                    st.session_state["tracked_target"] = next_target
                     st.session_state["switch_candidate"] = None
                     st.session_state["switch_candidate_frames"] = 0
                 else:
@@ -362,7 +442,8 @@ def _compute_active_target(path_detections: list[dict]) -> dict | None:
                 st.session_state["switch_candidate"] = None
                 st.session_state["switch_candidate_frames"] = 0
         else:
-            st.session_state["tracked_target"] = {**matched, "was_near": was_near}
+            matched["was_near"] = was_near
+            st.session_state["tracked_target"] = matched
             st.session_state["switch_candidate"] = None
             st.session_state["switch_candidate_frames"] = 0
 
@@ -372,10 +453,8 @@ def _compute_active_target(path_detections: list[dict]) -> dict | None:
     st.session_state["tracked_lost_frames"] = tracked_lost_frames
     if tracked_lost_frames >= config.TARGET_LOST_FRAMES_TO_SWITCH:
         selected = path_detections[0]
-        st.session_state["tracked_target"] = {
-            **selected,
-            "was_near": selected["distance"] <= config.NEAR_HAZARD_DISTANCE_M,
-        }
+        selected["was_near"] = selected["distance"] <= config.NEAR_HAZARD_DISTANCE_M
+        st.session_state["tracked_target"] = selected
         st.session_state["tracked_lost_frames"] = 0
         st.session_state["switch_candidate"] = None
         st.session_state["switch_candidate_frames"] = 0
@@ -462,102 +541,166 @@ def main() -> None:
     if not st.session_state["running"]:
         frame_box.info("Click Start to run live camera stream.")
         if st.session_state["alert_log"]:
-            alert_box.table(st.session_state["alert_log"][:8])
+            alert_box.table(list(itertools.islice(st.session_state["alert_log"], 8)))
         return
 
-    try:
-        should_process, frame = st.session_state["camera"].read()
-        if frame is None:
-            st.session_state["last_error"] = "Camera frame not available"
-            time.sleep(auto_refresh_ms / 1000.0)
-            st.rerun()
-            return
-        st.session_state["latest_frame"] = frame.copy()
-
-        if st.session_state.get("phase2_request", False):
-            st.session_state["phase2_request"] = False
+    # This full rerun just recreated the placeholders empty — force the
+    # dirty-flagged side panels to redraw on the first fragment tick.
+    st.session_state["hazard_text_drawn"] = ""
+    st.session_state["alerts_drawn_rev"] = None
+    st.session_state["description_drawn"] = None
+
+    # The whole streaming body runs inside a fragment: run_every reruns
+    # just this function on the timer, so the sidebar widgets, layout
+    # and _init_state no longer re-execute per tick (the old
+    # sleep+st.rerun loop tore down the full script every refresh).
+    # Widget interactions still trigger a normal full rerun, which
+    # recreates the fragment with the current slider values.
+    @st.fragment(run_every=auto_refresh_ms / 1000.0)
+    def _stream_tick() -> None:
+        try:
+            # Backpressure gate: widget interactions trigger a full
+            # rerun that runs the fragment on top of its timer, which
+            # would double-grab the camera and double-run inference.
+            # Skip the tick if the last frame shipped too recently.
+            now = time.monotonic()
+            if now - st.session_state["last_frame_ts"] < (auto_refresh_ms / 1000.0) * 0.5:
+                return
+            st.session_state["last_frame_ts"] = now
+
+            # Skipped frames are grab-only (no decode) and return None —
+            # drain them until the camera yields a processable frame.
+            should_process, frame = False, None
+            for _ in range(config.FRAME_SKIP * 2):
+                should_process, frame = st.session_state["camera"].read()
+                if frame is not None:
+                    break
+            if frame is None:
+                st.session_state["last_error"] = "Camera frame not available"
+                return
+            # Phase-2 snapshot: reuse one preallocated buffer via copyto
+            # instead of allocating a fresh full-frame copy every tick.
+            snapshot = st.session_state["latest_frame"]
+            if snapshot is None or snapshot.shape != frame.shape:
+                snapshot = np.empty_like(frame)
+                st.session_state["latest_frame"] = snapshot
+            np.copyto(snapshot, frame)
+
+            if st.session_state.get("phase2_request", False):
+                st.session_state["phase2_request"] = False
+                try:
+                    with st.spinner("Describing scene with Florence-2..."):
+                        ctx = _get_context()
+                        description = ctx.describe_scene(st.session_state["latest_frame"])
+                    st.session_state["phase2_description"] = description
+                    if tts_enabled and description:
+                        _maybe_speak_browser(description, True)
+                except Exception as e:
+                    st.session_state["phase2_description"] = f"Phase 2 error: {e}"
+
+            detections = st.session_state["last_detections"]
+            path_detections: list[dict] = []
+            active_target: dict | None = st.session_state["tracked_target"]
+
+            if should_process:
+                st.session_state["stream_frame_counter"] += 1
+                if st.session_state["stream_frame_counter"] % infer_every_n == 0:
+                    # Hand off to the inference worker, latest frame
+                    # wins. The copy keeps the worker off the buffer the
+                    # overlays get drawn onto below.
+                    _put_latest(st.session_state["infer_in_q"], frame.copy())
+
+            # Render never blocks on the model: take a fresh result if
+            # one is ready, otherwise redraw with cached detections.
             try:
-                with st.spinner("Describing scene with Florence-2..."):
-                    ctx = _get_context()
-                    description = ctx.describe_scene(st.session_state["latest_frame"])
-                st.session_state["phase2_description"] = description
-                if tts_enabled and description:
-                    _maybe_speak_browser(description, True)
-            except Exception as e:
-                st.session_state["phase2_description"] = f"Phase 2 error: {e}"
-
-        detections = st.session_state["last_detections"]
-        path_detections: list[dict] = []
-        active_target: dict | None = st.session_state["tracked_target"]
-
-        if should_process:
-            st.session_state["stream_frame_counter"] += 1
-            run_inference = (st.session_state["stream_frame_counter"] % infer_every_n == 0)
-
-            if run_inference:
-                detections = st.session_state["reflex"].process_frame(frame)
+                fresh = st.session_state["infer_out_q"].get_nowait()
+            except queue.Empty:
+                fresh = None
+
+            if fresh is not None:
+                detections = fresh
                 st.session_state["last_detections"] = detections
                 path_detections = _preprocess_path_detections(detections, frame.shape)
+                st.session_state["last_path_detections"] = path_detections
                 active_target = _compute_active_target(path_detections)
-            else:
-                detections = st.session_state["last_detections"]
-
-            if run_inference and active_target and st.session_state["debouncer"].should_alert(active_target["hazard"], active_target["distance"]):
-                msg = _build_message(active_target)
-                st.session_state["last_alert"] = msg
-                st.session_state["alert_log"].insert(
-                    0,
-                    {
-                        "time": time.strftime("%H:%M:%S"),
-                        "hazard": active_target["hazard"],
-                        "direction": active_target["direction"],
-                        "distance_m": active_target["distance"],
-                        "action": active_target.get("guidance", ""),
-                    },
-                )
-                st.session_state["alert_log"] = st.session_state["alert_log"][:40]
-                _maybe_speak_browser(msg, tts_enabled)
-
-        if not path_detections and detections:
-            path_detections = _preprocess_path_detections(detections, frame.shape)
-
-        vis = _draw_frame(frame, detections, path_detections, active_target)
-        vis = cv2.cvtColor(vis, cv2.COLOR_BGR2RGB)
-        data_uri = _frame_to_data_uri(vis, quality=65)
-        if data_uri:
-            frame_box.markdown(
-                f"<img src=\"{data_uri}\" style=\"width:100%;height:auto;border-radius:8px;\"/>",
-                unsafe_allow_html=True,
-            )
-        else:
-            frame_box.warning("Frame encode failed")
 
-        if active_target:
-            current_hazard_box.success(
-                (
+                if active_target and st.session_state["debouncer"].should_alert(active_target["hazard_id"], active_target["distance"]):
+                    msg = _build_message(active_target)
+                    st.session_state["last_alert"] = msg
+                    st.session_state["alert_log"].appendleft(
+                        {
+                            "time": time.strftime("%H:%M:%S"),
+                            "hazard": active_target["hazard"],
+                            "direction": active_target["direction"],
+                            "distance_m": active_target["distance"],
+                            "action": active_target.get("guidance", ""),
+                        }
+                    )
+                    st.session_state["alert_seq"] += 1
+                    _maybe_speak_browser(msg, tts_enabled)
+
+            if not path_detections:
+                # Non-inference ticks redraw from cached detections; the
+                # filtered list is cached alongside them instead of being
+                # recomputed from the same input every refresh.
+                path_detections = st.session_state["last_path_detections"]
+
+            vis = _draw_frame(frame, detections, path_detections, active_target)
+            # The browser renders at container width anyway — downscale
+            # after drawing (so overlays scale with the image) and before
+            # the color convert/encode so both touch fewer pixels.
+            h, w = vis.shape[:2]
+            if w > 960:
+                vis = cv2.resize(vis, (960, h * 960 // w), interpolation=cv2.INTER_AREA)
+            vis = cv2.cvtColor(vis, cv2.COLOR_BGR2RGB)
+            # Raw JPEG bytes via st.image — no base64 pass and ~25% fewer
+            # bytes on the Streamlit websocket than the old data-URI markup.
+            encode_start = time.perf_counter()
+            jpg = _encode_jpeg(vis, st.session_state["jpeg_quality"])
+            if jpg is not None:
+                frame_box.image(jpg, use_container_width=True)
+            else:
+                frame_box.warning("Frame encode failed")
+            _adapt_jpeg_quality((time.perf_counter() - encode_start) * 1000.0, auto_refresh_ms)
+
+            # Side panels are dirty-flagged: placeholders keep their
+            # previous content between fragment reruns, so unchanged
+            # state sends nothing over the websocket.
+            if active_target:
+                hazard_text = (
                     f"{active_target['hazard']} | {active_target['distance']} m | "
                     f"{active_target['direction']} | {active_target.get('guidance', '')}"
                 )
-            )
-        else:
-            current_hazard_box.info("No active hazard in path zone")
+            else:
+                hazard_text = None
+            if hazard_text != st.session_state["hazard_text_drawn"]:
+                if hazard_text is not None:
+                    current_hazard_box.success(hazard_text)
+                else:
+                    current_hazard_box.info("No active hazard in path zone")
+                st.session_state["hazard_text_drawn"] = hazard_text
 
-        if st.session_state["alert_log"]:
-            alert_box.table(st.session_state["alert_log"][:8])
-        else:
-            alert_box.info("No alerts yet")
+            alerts_rev = st.session_state["alert_seq"]
+            if alerts_rev != st.session_state["alerts_drawn_rev"]:
+                if st.session_state["alert_log"]:
+                    alert_box.table(list(itertools.islice(st.session_state["alert_log"], 8)))
+                else:
+                    alert_box.info("No alerts yet")
+                st.session_state["alerts_drawn_rev"] = alerts_rev
 
-        if st.session_state.get("phase2_description"):
-            desc_box.info(st.session_state["phase2_description"])
-        else:
-            desc_box.info("Press 'Describe Scene (Phase 2)' to capture and describe the current frame")
-
-    except Exception as e:
-        st.session_state["last_error"] = str(e)
-        st.error(f"Runtime error: {e}")
-    finally:
-        time.sleep(auto_refresh_ms / 1000.0)
-        st.rerun()
+            description = st.session_state.get("phase2_description", "")
+            if description != st.session_state["description_drawn"]:
+                if description:
+                    desc_box.info(description)
+                else:
+                    desc_box.info("Press 'Describe Scene (Phase 2)' to capture and describe the current frame")
+                st.session_state["description_drawn"] = description
+
+        except Exception as e:
+            st.session_state["last_error"] = str(e)
+            st.error(f"Runtime error: {e}")
+
+    _stream_tick()
 
 
 if __name__ == "__main__":